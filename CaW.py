@@ -18,15 +18,23 @@ Setup:
 """
 
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import ui
-import json, random, asyncio, os, io
+import json, random, asyncio, os, io, sys, time
+import concurrent.futures, concurrent.futures.process, functools
+from collections import OrderedDict
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Optional
 
-from card_renderer import render_black_card, render_judging, render_winner, render_hand
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads   # stdlib json accepts bytes too
+
 
 # ── Configuration ────────────────────────────────────────────────────────────
 
@@ -35,7 +43,12 @@ COMMAND_PREFIX = "!cah "
 HAND_SIZE = 10
 MIN_PLAYERS = 3
 DEFAULT_WIN_SCORE = 7
+NEXT_ROUND_DELAY = 3       # seconds to let the winner reveal sink in
+GAME_IDLE_TIMEOUT = 60 * 60  # games with no activity for this long are reaped
+STATUS_DEBOUNCE = 0.5      # seconds to gather submissions into one status edit
+RENDER_CACHE_SIZE = 64     # rendered PNGs kept for identical re-renders
 BLANK = "▬▬▬▬▬"
+STALE_HAND_MSG = "That hand is out of date — press **Play Card(s)** to get your current one."
 
 # Wild Card constants
 WILD_CARD_TEXT = "🃏 WILD CARD — Type your own answer!"
@@ -72,11 +85,15 @@ class C:
 
 # ── Avatar Helper ────────────────────────────────────────────────────────────
 
+# Shared across every channel so a burst of games can't pile up CDN requests
+AVATAR_FETCH_LIMIT = asyncio.Semaphore(16)
+
 async def fetch_avatar_bytes(member: discord.Member, size: int = 128) -> bytes | None:
     """Download a member's display avatar as PNG bytes. Returns None on failure."""
     try:
         asset = member.display_avatar.with_size(size).with_format("png")
-        return await asset.read()
+        async with AVATAR_FETCH_LIMIT:
+            return await asset.read()
     except Exception as e:
         print(f"WARNING: Could not fetch avatar for {member.display_name}: {e}")
         return None
@@ -84,96 +101,142 @@ async def fetch_avatar_bytes(member: discord.Member, size: int = 128) -> bytes |
 
 # ── Card Database ────────────────────────────────────────────────────────────
 
+@dataclass(frozen=True, slots=True)
+class BlackCard:
+    text:      str
+    pick:      int
+    pack_id:   str = ""
+    pack_name: str = ""
+    display:   str = ""   # text with blanks drawn in, plus the PICK hint
+
+
 class CardDB:
     def __init__(self, path: str | Path):
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
         self.packs: dict[str, dict] = data["packs"]
+        # Intern white texts (they're used as dict keys all game long) and
+        # build each black card once, with its prompt already formatted.
+        for pid, p in self.packs.items():
+            p["white"] = [sys.intern(w) for w in p["white"]]
+            p["black"] = [BlackCard(text=b["text"], pick=b["pick"],
+                                    pack_id=pid, pack_name=p["name"],
+                                    display=_fmt_black_prompt(b["text"], b["pick"]))
+                          for b in p["black"]]
+
+        # Pack listings and totals never change after load, so build them once
+        self._pack_info: dict[str, dict] = {
+            pid: {
+                "name": p["name"],
+                "description": p.get("description", ""),
+                "white_count": len(p["white"]),
+                "black_count": len(p["black"]),
+            }
+            for pid, p in self.packs.items()
+        }
+        self.total_white: int = sum(i["white_count"] for i in self._pack_info.values())
+        self.total_black: int = sum(i["black_count"] for i in self._pack_info.values())
 
     @property
     def pack_ids(self) -> list[str]:
         return list(self.packs.keys())
 
     def pack_info(self, pack_id: str) -> dict:
-        p = self.packs[pack_id]
-        return {
-            "name": p["name"],
-            "description": p.get("description", ""),
-            "white_count": len(p["white"]),
-            "black_count": len(p["black"]),
-        }
+        return self._pack_info[pack_id]
 
-    def build_deck(self, pack_ids: list[str]) -> tuple[list[str], list[dict], dict[str, str], dict[str, str]]:
+    def build_deck(self, pack_ids: list[str]) -> tuple[list[str], list[BlackCard], dict[str, str]]:
         whites, blacks = [], []
-        white_pack_ids:   dict[str, str] = {}
-        white_pack_names: dict[str, str] = {}
-        seen_white: set[str] = set()
+        # Doubles as the "seen" set for whites; names are looked up per pack
+        white_pack_ids: dict[str, str] = {}
         seen_black: set[str] = set()
         for pid in pack_ids:
             if pid in self.packs:
-                pack_name = self.packs[pid]["name"]
                 for w in self.packs[pid]["white"]:
-                    if w not in seen_white:
-                        seen_white.add(w)
+                    if w not in white_pack_ids:
                         whites.append(w)
-                        white_pack_ids[w]   = pid
-                        white_pack_names[w] = pack_name
+                        white_pack_ids[w] = pid
                 for b in self.packs[pid]["black"]:
-                    if b["text"] not in seen_black:
-                        seen_black.add(b["text"])
-                        blacks.append({**b, "pack_id": pid, "pack_name": pack_name})
-        return whites, blacks, white_pack_ids, white_pack_names
-
-    @property
-    def total_white(self) -> int:
-        return sum(len(p["white"]) for p in self.packs.values())
-
-    @property
-    def total_black(self) -> int:
-        return sum(len(p["black"]) for p in self.packs.values())
+                    if b.text not in seen_black:
+                        seen_black.add(b.text)
+                        blacks.append(b)
+        return whites, blacks, white_pack_ids
 
 
 class Deck:
-    def __init__(self, whites: list[str], blacks: list[dict], wild_count: int = 0, preshuffle: bool = True):
-        self.white_draw    = list(whites)
-        self.black_draw    = list(blacks)
-        self.white_discard: list[str]  = []
-        self.black_discard: list[dict] = []
-
-        # Inject Wild Cards evenly into the white draw pile
-        for _ in range(wild_count):
-            self.white_draw.append(WILD_CARD_TEXT)
+    """Draw piles are shuffled lazily: each draw swaps a random card from the
+    top tier to the end and pops it, so setup costs nothing per card.
+
+    A floor is the index below which cards wait until everything above has
+    been drawn (setup_deck keeps recently seen cards there).
+    """
+
+    def __init__(self, whites: list[str], blacks: list[BlackCard], wild_count: int = 0,
+                 white_floor: int = 0, black_floor: int = 0):
+        self.white_discard: list[str]       = []
+        self.black_discard: list[BlackCard] = []
+
+        self.white_draw = [*whites, *([WILD_CARD_TEXT] * wild_count)]
+        self.black_draw = list(blacks)
+        self._white_floors = [white_floor] if white_floor else []
+        # Wild Cards sit on top of the white draw pile
+        if wild_count:
+            self._white_floors.append(len(whites))
+        self._black_floors = [black_floor] if black_floor else []
+        self._settle_black_top()
 
-        if preshuffle:
-            random.shuffle(self.white_draw)
-            random.shuffle(self.black_draw)
+    @staticmethod
+    def _lazy_pop(pile: list, floors: list[int]):
+        while floors and floors[-1] >= len(pile):
+            floors.pop()
+        j = random.randrange(floors[-1] if floors else 0, len(pile))
+        pile[j], pile[-1] = pile[-1], pile[j]
+        return pile.pop()
+
+    def _settle_black_top(self):
+        # Keep the next black card at black_draw[-1] so it can be peeked at
+        if self.black_draw:
+            self.black_draw.append(self._lazy_pop(self.black_draw, self._black_floors))
 
     def draw_white(self, n: int = 1) -> list[str]:
+        if n <= 0:
+            return []
         cards = []
-        for _ in range(n):
-            if not self.white_draw:
-                if not self.white_discard:
-                    raise RuntimeError("No white cards left!")
-                self.white_draw   = self.white_discard
-                self.white_discard = []
-                random.shuffle(self.white_draw)
-            cards.append(self.white_draw.pop())
+        if len(self.white_draw) < n:
+            if len(self.white_draw) + len(self.white_discard) < n:
+                raise RuntimeError("No white cards left!")
+            # Take what's left, then bring the discard pile back as the draw pile
+            cards = self.white_draw
+            n    -= len(cards)
+            self._refill_white()
+        cards.extend(self._lazy_pop(self.white_draw, self._white_floors) for _ in range(n))
         return cards
 
-    def draw_black(self) -> dict:
+    def draw_black(self) -> BlackCard:
         if not self.black_draw:
             if not self.black_discard:
                 raise RuntimeError("No black cards left!")
-            self.black_draw    = self.black_discard
-            self.black_discard = []
-            random.shuffle(self.black_draw)
-        return self.black_draw.pop()
+            self._refill_black()
+        card = self.black_draw.pop()
+        self._settle_black_top()
+        return card
+
+    def _refill_white(self):
+        # The discard list becomes the new draw pile as-is; draws randomise it,
+        # and cards below the old pile are never re-dealt while they may still
+        # sit in someone's hand.
+        self.white_draw, self.white_discard = self.white_discard, []
+        self._white_floors.clear()
+
+    def _refill_black(self):
+        self.black_draw, self.black_discard = self.black_discard, []
+        self._black_floors.clear()
+        self._settle_black_top()
 
     def discard_white(self, cards: list[str]):
         # Never put Wild Cards back in the discard (they'd recycle forever)
         self.white_discard.extend(c for c in cards if c != WILD_CARD_TEXT)
 
-    def discard_black(self, card: dict):
+    def discard_black(self, card: BlackCard):
         self.black_discard.append(card)
 
     def draw_random_white(self) -> str:
@@ -181,13 +244,9 @@ class Deck:
         if not self.white_draw:
             if not self.white_discard:
                 raise RuntimeError("No white cards left!")
-            self.white_draw   = self.white_discard
-            self.white_discard = []
-            random.shuffle(self.white_draw)
-        idx = random.randrange(len(self.white_draw))
-        # Swap with last and pop for O(1) removal
-        self.white_draw[idx], self.white_draw[-1] = self.white_draw[-1], self.white_draw[idx]
-        return self.white_draw.pop()
+            self._refill_white()
+        # Ignores the floors: any remaining card, recently seen or not
+        return self._lazy_pop(self.white_draw, [])
 
 
 # ── Recent-Card Memory ───────────────────────────────────────────────────────
@@ -232,16 +291,18 @@ class GameMode(Enum):
     ADHOC = auto()
     FULL  = auto()
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     member: discord.Member
     hand:          list[str] = field(default_factory=list)
     score:         int       = 0
     pending_picks: list[str] = field(default_factory=list)
+    # Display name as of joining. Scoreboards and round messages all read
+    # this one snapshot, so a mid-game nickname change can't split them.
+    name:          str       = field(init=False)
 
-    @property
-    def name(self) -> str:
-        return self.member.display_name
+    def __post_init__(self):
+        self.name = self.member.display_name
 
     @property
     def id(self) -> int:
@@ -249,6 +310,16 @@ class Player:
 
 
 class Game:
+    __slots__ = (
+        "channel", "host", "mode", "win_score", "deck", "selected_packs", "wild_count",
+        "white_pack_ids", "pack_names", "phase", "players", "scores", "names", "_scores_text",
+        "czar_order", "czar_index", "round_number",
+        "black_card", "submissions", "submission_order",
+        "round_view", "_round_msg", "_status_task", "_status_dirty", "_status_sig",
+        "_prerender_task", "_winner_renders",
+        "channel_recent", "_seen_whites", "_seen_blacks", "last_activity",
+    )
+
     def __init__(self, channel: discord.TextChannel, host: discord.Member,
                  mode: GameMode, win_score: int):
         self.channel    = channel
@@ -260,47 +331,70 @@ class Game:
         self.wild_count: int = 0          # number of Wild Cards injected this game
 
         self.white_pack_ids:   dict[str, str] = {}
-        self.white_pack_names: dict[str, str] = {}
+        self.pack_names:       dict[str, str] = {}
 
         self.phase          = Phase.LOBBY
         self.players:       dict[int, Player] = {}
+        # Flat per-player views for the scoreboard paths, kept in step with players;
+        # names mirrors each Player.name snapshot
+        self.scores:        dict[int, int] = {}
+        self.names:         dict[int, str] = {}
+        # fmt_scores output by compact flag; cleared whenever scores or names change
+        self._scores_text:  dict[bool, str] = {}
         self.czar_order:    list[int] = []
         self.czar_index:    int = 0
         self.round_number:  int = 0
 
-        self.black_card:       Optional[dict]      = None
+        self.black_card:       Optional[BlackCard] = None
         self.submissions:      dict[int, list[str]] = {}
         self.submission_order: list[int]            = []
 
         self.round_view: Optional["RoundPlayView"] = None
+        self._round_msg: Optional[discord.Message] = None
+        self._status_task:  Optional[asyncio.Task] = None
+        self._status_dirty: bool = False
+        self._status_sig:   Optional[tuple] = None
+        self._prerender_task: Optional[asyncio.Task] = None
+        self._winner_renders: dict[int, asyncio.Task] = {}
 
         self.channel_recent = recent_cards.setdefault(channel.id, ChannelRecent())
 
         self._seen_whites: set[str] = set()
         self._seen_blacks: set[str] = set()
 
+        self.last_activity = time.monotonic()
+
     def add_player(self, member: discord.Member) -> bool:
         if member.id in self.players:
             return False
-        self.players[member.id] = Player(member=member)
+        self.last_activity = time.monotonic()
+        player = self.players[member.id] = Player(member=member)
+        self.scores[member.id]  = 0
+        self.names[member.id]   = player.name
+        self._scores_text.clear()
         self.czar_order.append(member.id)
         return True
 
     def remove_player(self, member_id: int) -> Optional[Player]:
         p = self.players.pop(member_id, None)
         if p:
+            del self.scores[member_id], self.names[member_id]
+            self._scores_text.clear()
             if self.deck:
                 self.deck.discard_white(p.hand)
                 self.deck.discard_white(p.pending_picks)
-            if member_id in self.czar_order:
-                self.czar_order.remove(member_id)
-                if self.czar_index >= len(self.czar_order) and self.czar_order:
-                    self.czar_index = 0
+            # czar_order holds exactly the ids in players, so p being found means it is here
+            removed_idx = self.czar_order.index(member_id)
+            self.czar_order.pop(removed_idx)
+            # Keep the current czar in place when someone ahead of them leaves
+            if removed_idx < self.czar_index:
+                self.czar_index -= 1
+            if self.czar_index >= len(self.czar_order):
+                self.czar_index = 0
             if member_id in self.submissions:
                 if self.deck:
                     self.deck.discard_white(self.submissions.pop(member_id))
-                if member_id in self.submission_order:
-                    self.submission_order.remove(member_id)
+                self.submission_order = [pid for pid in self.submission_order if pid != member_id]
         return p
 
     @property
@@ -316,61 +410,80 @@ class Game:
 
     def setup_deck(self, pack_ids: list[str], db: CardDB):
         self.selected_packs = pack_ids
-        whites, blacks, white_pack_ids, white_pack_names = db.build_deck(pack_ids)
+        whites, blacks, white_pack_ids = db.build_deck(pack_ids)
 
+        # Recently seen cards go underneath; the deck shuffles lazily as it deals
         recent_white_set = set(self.channel_recent.whites)
         fresh_w = [w for w in whites if w not in recent_white_set]
         stale_w = [w for w in whites if w in recent_white_set]
-        random.shuffle(fresh_w)
-        random.shuffle(stale_w)
-        ordered_whites = stale_w + fresh_w
 
         recent_black_set = set(self.channel_recent.blacks)
-        fresh_b = [b for b in blacks if b["text"] not in recent_black_set]
-        stale_b = [b for b in blacks if b["text"] in recent_black_set]
-        random.shuffle(fresh_b)
-        random.shuffle(stale_b)
-        ordered_blacks = stale_b + fresh_b
+        fresh_b = [b for b in blacks if b.text not in recent_black_set]
+        stale_b = [b for b in blacks if b.text in recent_black_set]
 
         # Calculate Wild Cards: 1 per WILD_CARD_INTERVAL white cards (rounded down)
         self.wild_count = len(whites) // WILD_CARD_INTERVAL
-        self.deck             = Deck(ordered_whites, ordered_blacks,
-                                     wild_count=self.wild_count, preshuffle=False)
+        self.deck             = Deck(stale_w + fresh_w, stale_b + fresh_b,
+                                     wild_count=self.wild_count,
+                                     white_floor=len(stale_w), black_floor=len(stale_b))
         self.white_pack_ids   = white_pack_ids
-        self.white_pack_names = white_pack_names
+        self.pack_names       = {pid: db.packs[pid]["name"] for pid in pack_ids if pid in db.packs}
+
+    def white_pack_name(self, card: str) -> str:
+        return self.pack_names.get(self.white_pack_ids.get(card, ""), "")
 
-    def start_round(self) -> dict:
+    def start_round(self) -> BlackCard:
         self.round_number += 1
         self.phase = Phase.PLAYING
+        self.last_activity = time.monotonic()
         self.submissions.clear()
         self.submission_order.clear()
         self.black_card = self.deck.draw_black()
-        self._seen_blacks.add(self.black_card["text"])
+        self._seen_blacks.add(self.black_card.text)
+        # Deal the whole round from one draw, then slice it out to each hand
+        deficits = []
         for player in self.players.values():
             player.pending_picks.clear()
-            deficit = HAND_SIZE - len(player.hand)
-            if deficit > 0:
-                drawn = self.deck.draw_white(deficit)
-                self._seen_whites.update(drawn)
-                player.hand.extend(drawn)
+            deficits.append((player, max(HAND_SIZE - len(player.hand), 0)))
+        drawn = self.deck.draw_white(sum(n for _, n in deficits))
+        self._seen_whites.update(drawn)
+        pos = 0
+        for player, n in deficits:
+            player.hand.extend(drawn[pos:pos + n])
+            pos += n
         return self.black_card
 
-    def submit_card_by_value(self, player_id: int, card_text: str):
+    def submit_card_at(self, player_id: int, index: int):
+        """Move the card at ``index`` in the hand straight to pending_picks."""
         player = self.players[player_id]
-        if card_text in player.hand:
-            player.hand.remove(card_text)
-            player.pending_picks.append(card_text)
+        player.pending_picks.append(player.hand.pop(index))
 
     def submit_wild_by_text(self, player_id: int, wild_slot_index: int, custom_text: str):
         """Replace the Wild Card placeholder in pending_picks with the typed text."""
         player = self.players[player_id]
-        # Remove the placeholder from hand
-        if WILD_CARD_TEXT in player.hand:
+        # Remove the placeholder from hand (absent when pulled from the deck)
+        try:
             player.hand.remove(WILD_CARD_TEXT)
+        except ValueError:
+            pass
         player.pending_picks.append(custom_text)
 
+    def expects_pick(self, player_id: int, round_number: int, pick_num: int) -> bool:
+        """Whether a hand prompt from ``round_number`` asking for ``pick_num`` is still current.
+
+        Players can hold several prompts at once (Play clicked twice, a modal left
+        open), so every one re-checks before touching the hand.
+        """
+        player = self.players.get(player_id)
+        return (player is not None
+                and self.phase == Phase.PLAYING
+                and self.round_number == round_number
+                and player_id not in self.submissions
+                and len(player.pending_picks) == pick_num - 1)
+
     def finalize_submission(self, player_id: int):
         player = self.players[player_id]
+        self.last_activity = time.monotonic()
         self.submissions[player_id] = list(player.pending_picks)
         player.pending_picks.clear()
 
@@ -379,16 +492,33 @@ class Game:
         player.hand.extend(player.pending_picks)
         player.pending_picks.clear()
 
+    def abort_round(self):
+        """Hand every played or half-played card back, retire the black card and drop its winner renders."""
+        for pid, cards in self.submissions.items():
+            if pid in self.players:
+                self.players[pid].hand.extend(cards)
+        self.submissions.clear()
+        for pid in self.players:
+            self.cancel_pending(pid)
+        if self.black_card:
+            self.deck.discard_black(self.black_card)
+        for task in self._winner_renders.values():
+            task.cancel()
+        self._winner_renders = {}
+
     def all_submitted(self) -> bool:
-        expected = {pid for pid in self.players if pid != self.czar_id}
-        return expected == set(self.submissions.keys())
+        # Only non-czar players can ever land in submissions (the play buttons
+        # reject the czar, and a czar leaving mid-round clears them), so a
+        # count comparison is enough.
+        return len(self.submissions) == len(self.players) - (1 if self.czar_id in self.players else 0)
 
     def begin_judging(self) -> list[tuple[int, list[str]]]:
         self.phase = Phase.JUDGING
-        entries = list(self.submissions.items())
-        random.shuffle(entries)
-        self.submission_order = [pid for pid, _ in entries]
-        return entries
+        # Shuffle the ids in place and keep that list as the order itself
+        order = list(self.submissions)
+        random.shuffle(order)
+        self.submission_order = order
+        return [(pid, self.submissions[pid]) for pid in order]
 
     def pick_winner(self, choice: int) -> Player:
         if choice < 1 or choice > len(self.submission_order):
@@ -396,6 +526,8 @@ class Game:
         winner_id = self.submission_order[choice - 1]
         winner = self.players[winner_id]
         winner.score += 1
+        self.scores[winner_id] = winner.score
+        self._scores_text.clear()
         for cards in self.submissions.values():
             self.deck.discard_white(cards)
         self.deck.discard_black(self.black_card)
@@ -407,10 +539,7 @@ class Game:
     def check_game_over(self) -> Optional[Player]:
         if self.mode == GameMode.ADHOC:
             return None
-        for p in self.players.values():
-            if p.score >= self.win_score:
-                return p
-        return None
+        return next((self.players[pid] for pid, s in self.scores.items() if s >= self.win_score), None)
 
     def record_recent(self):
         for player in self.players.values():
@@ -419,7 +548,7 @@ class Game:
         for cards in self.submissions.values():
             self._seen_whites.update(cards)
         if self.black_card:
-            self._seen_blacks.add(self.black_card["text"])
+            self._seen_blacks.add(self.black_card.text)
 
         self.channel_recent.add_whites(list(self._seen_whites))
         self.channel_recent.add_blacks(list(self._seen_blacks))
@@ -427,8 +556,8 @@ class Game:
 
 # ── Formatting ───────────────────────────────────────────────────────────────
 
-def fmt_black(card: dict, answers: list[str] = None) -> str:
-    text = card["text"]
+def fmt_black(card: BlackCard, answers: list[str] = None) -> str:
+    text = card.text
     if answers:
         if "_" in text:
             for ans in answers:
@@ -436,52 +565,128 @@ def fmt_black(card: dict, answers: list[str] = None) -> str:
         else:
             text = text + " **" + "** **".join(answers) + "**"
         return text
+    return card.display
+
+def _fmt_black_prompt(text: str, pick: int) -> str:
     formatted = text.replace("_", BLANK)
-    if card["pick"] > 1:
-        formatted += f"\n\n*⎡ PICK {card['pick']} — play cards one at a time, in order ⎤*"
+    if pick > 1:
+        formatted += f"\n\n*⎡ PICK {pick} — play cards one at a time, in order ⎤*"
     return formatted
 
-def fmt_scores(players: dict[int, Player], compact: bool = False) -> str:
-    sorted_p = sorted(players.values(), key=lambda p: p.score, reverse=True)
+def fmt_scores(game: Game, compact: bool = False) -> str:
+    cached = game._scores_text.get(compact)
+    if cached is not None:
+        return cached
+    sorted_s = sorted(game.scores.items(), key=itemgetter(1), reverse=True)
+    names    = game.names
     medals   = ["🥇", "🥈", "🥉"]
-    lines    = []
-    for i, p in enumerate(sorted_p):
-        medal = medals[i] if i < len(medals) else "▫️"
-        pts   = f"{p.score} pt{'s' if p.score != 1 else ''}"
-        lines.append(f"{medal} **{p.name}** — {pts}" if not compact else f"{medal} {p.name}: {pts}")
-    return "\n".join(lines)
+    text = game._scores_text[compact] = "\n".join(
+        f"{medals[i] if i < 3 else '▫️'} {names[pid]}: {score} pt{'s' if score != 1 else ''}" if compact else
+        f"{medals[i] if i < 3 else '▫️'} **{names[pid]}** — {score} pt{'s' if score != 1 else ''}"
+        for i, (pid, score) in enumerate(sorted_s))
+    return text
 
 def trunc(text: str, n: int = 95) -> str:
     return text[:n] + "…" if len(text) > n else text
 
 def submitted_names(game: Game) -> list[str]:
-    return [game.players[pid].name for pid in game.submissions]
-
-def in_progress_names(game: Game) -> list[str]:
-    return [game.players[pid].name for pid in game.players
-            if pid != game.czar_id
-            and pid not in game.submissions
-            and game.players[pid].pending_picks]
+    return [game.names[pid] for pid in game.submissions]
+
+def waiting_names(game: Game) -> tuple[list[str], list[str]]:
+    """One pass over players: (everyone still owing cards, those part-way through)."""
+    czar_id, names = game.czar_id, game.names
+    waiting, in_prog = [], []
+    for pid, p in game.players.items():
+        if pid == czar_id or pid in game.submissions:
+            continue
+        waiting.append(names[pid])
+        if p.pending_picks:
+            in_prog.append(names[pid])
+    return waiting, in_prog
 
 def is_wild(card_text: str) -> bool:
     return card_text == WILD_CARD_TEXT
 
 
+# ── Image rendering ───────────────────────────────────────────────────────────
+
+# Pillow rendering is pure CPU work; doing it in worker processes keeps the
+# gateway heartbeating and other interactions flowing while a grid is drawn.
+def _init_render_worker():
+    # Decode and pre-scale pack logos while the worker spins up, not mid-round
+    import card_renderer
+    card_renderer.warm_caches()
+
+def _new_render_pool() -> concurrent.futures.ProcessPoolExecutor:
+    return concurrent.futures.ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                  initializer=_init_render_worker)
+
+_RENDER_POOL = _new_render_pool()
+
+def _call_renderer(name: str, *args, **kwargs) -> io.BytesIO:
+    # Runs in a worker: only the render processes ever import Pillow
+    import card_renderer
+    return getattr(card_renderer, name)(*args, **kwargs)
+
+async def render_async(name: str, *args, **kwargs) -> io.BytesIO:
+    """Run the card_renderer function called ``name`` in the render pool."""
+    global _RENDER_POOL
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_call_renderer, name, *args, **kwargs)
+    pool = _RENDER_POOL
+    try:
+        return await loop.run_in_executor(pool, call)
+    except concurrent.futures.process.BrokenProcessPool:
+        # A worker died (OOM kill, segfault) and the executor never recovers on
+        # its own; swap in a fresh pool, unless a concurrent render already has
+        if _RENDER_POOL is pool:
+            print("WARNING: Render pool broke; starting a new one.")
+            _RENDER_POOL = _new_render_pool()
+            pool.shutdown(wait=False)
+        return await loop.run_in_executor(_RENDER_POOL, call)
+
+
+_render_cache: OrderedDict[tuple, bytes] = OrderedDict()
+
+def _freeze(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+async def render_cached(name: str, *args, **kwargs) -> io.BytesIO:
+    """render_async with an LRU of finished PNG bytes keyed on every input (avatars included)."""
+    key  = (name, _freeze(args), _freeze(kwargs))
+    data = _render_cache.get(key)
+    if data is None:
+        data = (await render_async(name, *args, **kwargs)).getvalue()
+        _render_cache[key] = data
+        if len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    else:
+        _render_cache.move_to_end(key)
+    return io.BytesIO(data)
+
+
 # ── Hand image helper ─────────────────────────────────────────────────────────
 
-def _build_hand_image(game: Game, player: Player) -> discord.File:
+async def _build_hand_image(game: Game, player: Player) -> discord.File:
+    hand      = list(player.hand)
     submitted = game.submissions.get(player.id, [])
 
-    if not player.hand:
+    if not hand:
         print(f"WARNING: Player {player.name} has empty hand!")
 
     try:
-        hand_img = render_hand(
-            player.hand,
-            white_pack_ids=game.white_pack_ids,
-            white_pack_names=game.white_pack_names,
-            pending=player.pending_picks,
-            submitted=submitted,
+        # Only ship the pack lookups for cards in this hand across to the worker
+        hand_img = await render_async(
+            "render_hand",
+            hand,
+            white_pack_ids={c: game.white_pack_ids.get(c) for c in hand},
+            white_pack_names={c: game.white_pack_name(c) for c in hand},
+            pending=list(player.pending_picks),
+            submitted=list(submitted),
         )
         return discord.File(hand_img, filename="hand.png")
     except Exception as e:
@@ -508,11 +713,14 @@ class WildCardModal(ui.Modal, title="🃏 Wild Card — Write Your Answer"):
         self.pick_num        = pick_num
         self.total_picks     = total_picks
         self.wild_slot_index = wild_slot_index
+        self.round_number    = game.round_number
 
     async def on_submit(self, interaction: discord.Interaction):
         custom_text = self.answer.value.strip()
         if not custom_text:
             return await interaction.response.send_message("Answer can't be empty!", ephemeral=True)
+        if not self.game.expects_pick(self.player.id, self.round_number, self.pick_num):
+            return await interaction.response.send_message(STALE_HAND_MSG, ephemeral=True)
 
         self.game.submit_wild_by_text(self.player.id, self.wild_slot_index, custom_text)
 
@@ -526,7 +734,7 @@ class WildCardModal(ui.Modal, title="🃏 Wild Card — Write Your Answer"):
                     description=f"You played:\n{played_str}",
                     color=C.GREEN),
                 ephemeral=True)
-            await update_round_status(self.game)
+            schedule_round_status(self.game)
             if self.game.all_submitted():
                 await begin_judging_phase(self.game)
         else:
@@ -541,7 +749,7 @@ class WildCardModal(ui.Modal, title="🃏 Wild Card — Write Your Answer"):
                     color=C.ORANGE),
                 ephemeral=True)
             next_view  = EphemeralHandSelect(self.game, self.player, next_num, self.total_picks)
-            hand_file  = _build_hand_image(self.game, self.player)
+            hand_file  = await _build_hand_image(self.game, self.player)
             bc         = fmt_black(self.game.black_card)
             await interaction.followup.send(
                 embed=discord.Embed(
@@ -563,7 +771,14 @@ class PackSelectView(ui.View):
         first = "base" if "base" in db.pack_ids else db.pack_ids[0]
         self.selected: set[str] = {first}
 
-        for idx, pid in enumerate(list(db.pack_ids)[:20]):
+        # Everything but the tick is fixed, so each pack's embed line is built once
+        self._pack_lines: dict[str, str] = {}
+        for pid in db.pack_ids:
+            info = db.pack_info(pid)
+            self._pack_lines[pid] = f"**{info['name']}** — {info['white_count']}⬜ {info['black_count']}⬛ — *{info['description']}*"
+
+        self._btn_by_pid: dict[str, ui.Button] = {}
+        for idx, pid in enumerate(db.pack_ids[:20]):
             info  = db.pack_info(pid)
             is_on = pid in self.selected
             btn   = ui.Button(
@@ -574,6 +789,7 @@ class PackSelectView(ui.View):
                 row=self._btn_row(idx),
             )
             btn.callback = self._make_toggle(pid)
+            self._btn_by_pid[pid] = btn
             self.add_item(btn)
 
         confirm          = ui.Button(
@@ -602,12 +818,10 @@ class PackSelectView(ui.View):
                 self.selected.discard(pid)
             else:
                 self.selected.add(pid)
-            for child in self.children:
-                if getattr(child, "custom_id", None) == f"pack_toggle_{pid}":
-                    is_on        = pid in self.selected
-                    child.emoji  = "✅" if is_on else "⬜"
-                    child.style  = discord.ButtonStyle.success if is_on else discord.ButtonStyle.secondary
-                    break
+            btn       = self._btn_by_pid[pid]
+            is_on     = pid in self.selected
+            btn.emoji = "✅" if is_on else "⬜"
+            btn.style = discord.ButtonStyle.success if is_on else discord.ButtonStyle.secondary
             await interaction.response.edit_message(embed=self._build_embed(), view=self)
         return toggle
 
@@ -635,15 +849,19 @@ class PackSelectView(ui.View):
             view=lobby_view)
 
     def _build_embed(self) -> discord.Embed:
-        total_w    = sum(self.db.pack_info(p)["white_count"] for p in self.selected)
-        total_b    = sum(self.db.pack_info(p)["black_count"] for p in self.selected)
+        total_w = total_b = 0
+        names, lines = [], []
+        for pid, line in self._pack_lines.items():
+            if pid in self.selected:
+                info     = self.db.pack_info(pid)
+                total_w += info["white_count"]
+                total_b += info["black_count"]
+                names.append(info["name"])
+                lines.append(f"✅ {line}")
+            else:
+                lines.append(f"⬜ {line}")
         wild_count = total_w // WILD_CARD_INTERVAL
-        pack_names = ", ".join(self.db.pack_info(p)["name"] for p in self.selected)
-        lines = []
-        for pid in self.db.pack_ids:
-            info = self.db.pack_info(pid)
-            tick = "✅" if pid in self.selected else "⬜"
-            lines.append(f"{tick} **{info['name']}** — {info['white_count']}⬜ {info['black_count']}⬛ — *{info['description']}*")
+        pack_names = ", ".join(names)
         wild_line = (f"\n🃏 **Wild Cards:** {wild_count} (1 per {WILD_CARD_INTERVAL} white cards)"
                      if wild_count > 0 else "")
         return discord.Embed(
@@ -670,9 +888,10 @@ class LobbyView(ui.View):
         mode     = f"First to **{self.game.win_score}** points" if self.game.mode == GameMode.FULL else "**Quick Round**"
         pack_line = ""
         if self.game.selected_packs:
-            pack_names = ", ".join(self.db.pack_info(p)["name"] for p in self.game.selected_packs)
-            total_w    = sum(self.db.pack_info(p)["white_count"] for p in self.game.selected_packs)
-            total_b    = sum(self.db.pack_info(p)["black_count"] for p in self.game.selected_packs)
+            infos      = [self.db.pack_info(p) for p in self.game.selected_packs]
+            pack_names = ", ".join(i["name"] for i in infos)
+            total_w    = sum(i["white_count"] for i in infos)
+            total_b    = sum(i["black_count"] for i in infos)
             wild_part  = (f" + {self.game.wild_count}🃏" if self.game.wild_count > 0 else "")
             pack_line  = f"\n📦 **Packs:** {pack_names} ({total_w}⬜{wild_part} {total_b}⬛)"
         embed = discord.Embed(
@@ -720,7 +939,10 @@ class EphemeralHandSelect(ui.View):
         self.player      = player
         self.pick_num    = pick_num
         self.total_picks = total_picks
+        self.round_number = game.round_number
         self.done        = False
+        # The hand these options were built from; option values index into it
+        self.hand        = tuple(player.hand)
 
         ordinals = {1: "first", 2: "second", 3: "third"}
         label    = "Pick a card" if total_picks == 1 else f"Pick your {ordinals.get(pick_num, f'#{pick_num}')} card"
@@ -738,6 +960,10 @@ class EphemeralHandSelect(ui.View):
             return await interaction.response.send_message("Already submitted!", ephemeral=True)
         if interaction.user.id != self.player.id:
             return await interaction.response.send_message("This isn't your hand!", ephemeral=True)
+        if not self.game.expects_pick(self.player.id, self.round_number, self.pick_num):
+            self.done = True
+            self.stop()
+            return await interaction.response.send_message(STALE_HAND_MSG, ephemeral=True)
 
         try:
             drawn = self.game.deck.draw_random_white()
@@ -753,7 +979,6 @@ class EphemeralHandSelect(ui.View):
             modal.answer.label = f"Wild Card — Pick {self.pick_num} of {self.total_picks}"
             return await interaction.response.send_modal(modal)
 
-        self.game.submit_card_by_value.__func__  # ensure it's the right method
         # Manually add the drawn card to pending (it wasn't in hand)
         self.player.pending_picks.append(drawn)
         self.game._seen_whites.add(drawn)
@@ -770,7 +995,7 @@ class EphemeralHandSelect(ui.View):
                     description=f"You pulled and played:\n{played_str}",
                     color=C.GREEN),
                 view=None)
-            await update_round_status(self.game)
+            schedule_round_status(self.game)
             if self.game.all_submitted():
                 await begin_judging_phase(self.game)
         else:
@@ -787,7 +1012,7 @@ class EphemeralHandSelect(ui.View):
                     color=C.ORANGE),
                 view=None)
             next_view  = EphemeralHandSelect(self.game, self.player, next_num, self.total_picks)
-            hand_file  = _build_hand_image(self.game, self.player)
+            hand_file  = await _build_hand_image(self.game, self.player)
             bc         = fmt_black(self.game.black_card)
             await interaction.followup.send(
                 embed=discord.Embed(
@@ -799,9 +1024,14 @@ class EphemeralHandSelect(ui.View):
     async def on_select(self, interaction: discord.Interaction):
         if self.done:
             return await interaction.response.send_message("Already submitted!", ephemeral=True)
+        if not self.game.expects_pick(self.player.id, self.round_number, self.pick_num):
+            self.done = True
+            self.stop()
+            return await interaction.response.send_message(STALE_HAND_MSG, ephemeral=True)
 
         idx = int(interaction.data["values"][0])
-        if idx >= len(self.player.hand):
+        # Only pop by index while that slot still holds the card this dropdown showed
+        if idx >= len(self.player.hand) or self.player.hand[idx] != self.hand[idx]:
             return await interaction.response.send_message("Invalid card.", ephemeral=True)
 
         card_text = self.player.hand[idx]
@@ -815,7 +1045,7 @@ class EphemeralHandSelect(ui.View):
             modal.answer.label = f"Wild Card — Pick {self.pick_num} of {self.total_picks}"
             return await interaction.response.send_modal(modal)
 
-        self.game.submit_card_by_value(self.player.id, card_text)
+        self.game.submit_card_at(self.player.id, idx)
 
         if self.pick_num >= self.total_picks:
             self.game.finalize_submission(self.player.id)
@@ -826,7 +1056,7 @@ class EphemeralHandSelect(ui.View):
             await interaction.response.edit_message(
                 embed=discord.Embed(title="✅ Cards Submitted!", description=f"You played:\n{played_str}", color=C.GREEN),
                 view=None)
-            await update_round_status(self.game)
+            schedule_round_status(self.game)
             if self.game.all_submitted():
                 await begin_judging_phase(self.game)
         else:
@@ -843,7 +1073,7 @@ class EphemeralHandSelect(ui.View):
                     color=C.ORANGE),
                 view=None)
             next_view  = EphemeralHandSelect(self.game, self.player, next_num, self.total_picks)
-            hand_file  = _build_hand_image(self.game, self.player)
+            hand_file  = await _build_hand_image(self.game, self.player)
             bc         = fmt_black(self.game.black_card)
             await interaction.followup.send(
                 embed=discord.Embed(
@@ -888,18 +1118,21 @@ class RoundPlayView(ui.View):
             next_num      = len(player.pending_picks) + 1
             next_label    = ordinals.get(next_num, f"#{next_num}")
             picked_so_far = ", ".join(f"**{c}**" for c in player.pending_picks)
-            view          = EphemeralHandSelect(game, player, next_num, game.black_card["pick"])
-            hand_file     = _build_hand_image(game, player)
-            return await interaction.response.send_message(
+            view          = EphemeralHandSelect(game, player, next_num, game.black_card.pick)
+            # Rendering the hand can outlast the 3s interaction window — ack first
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            hand_file     = await _build_hand_image(game, player)
+            return await interaction.followup.send(
                 embed=discord.Embed(
                     title=f"🃏 Continue — pick your {next_label} card",
                     description=f"**Black Card:**\n>>> {bc}\n\n**Already picked:** {picked_so_far}\n\n*Your hand is shown below.*",
                     color=C.PURPLE).set_image(url="attachment://hand.png"),
                 file=hand_file, view=view, ephemeral=True)
 
-        pick      = game.black_card["pick"]
+        pick      = game.black_card.pick
         view      = EphemeralHandSelect(game, player, 1, pick)
-        hand_file = _build_hand_image(game, player)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        hand_file = await _build_hand_image(game, player)
         embed     = discord.Embed(title=f"🃏 Your Hand — Round {game.round_number}", color=C.BLACK)
         embed.add_field(name="⬛ Black Card", value=f">>> {bc}", inline=False)
         embed.set_image(url="attachment://hand.png")
@@ -907,7 +1140,7 @@ class RoundPlayView(ui.View):
             embed.set_footer(text=f"This card requires {pick} answers — pick them one at a time, in order!")
         else:
             embed.set_footer(text="Select a card from the dropdown below.")
-        await interaction.response.send_message(embed=embed, file=hand_file, view=view, ephemeral=True)
+        await interaction.followup.send(embed=embed, file=hand_file, view=view, ephemeral=True)
 
     @ui.button(label="Pull From Deck", style=discord.ButtonStyle.blurple, emoji="🎲", row=0)
     async def pull_btn(self, interaction: discord.Interaction, button: ui.Button):
@@ -930,7 +1163,7 @@ class RoundPlayView(ui.View):
                 ephemeral=True)
 
         player      = game.players[uid]
-        total_picks = game.black_card["pick"]
+        total_picks = game.black_card.pick
         pick_num    = len(player.pending_picks) + 1
 
         try:
@@ -958,7 +1191,7 @@ class RoundPlayView(ui.View):
                     description=f"You pulled and played:\n{played_str}",
                     color=C.GREEN),
                 ephemeral=True)
-            await update_round_status(game)
+            schedule_round_status(game)
             if game.all_submitted():
                 await begin_judging_phase(game)
         else:
@@ -968,8 +1201,9 @@ class RoundPlayView(ui.View):
             picked_so_far = ", ".join(f"**{c}**" for c in player.pending_picks)
             bc            = fmt_black(game.black_card)
             next_view     = EphemeralHandSelect(game, player, next_num, total_picks)
-            hand_file     = _build_hand_image(game, player)
-            await interaction.response.send_message(
+            await interaction.response.defer(ephemeral=True, thinking=True)
+            hand_file     = await _build_hand_image(game, player)
+            await interaction.followup.send(
                 embed=discord.Embed(
                     title=f"🎲 Pulled: **{drawn}** — now pick your {next_label} card",
                     description=f"**Black Card:**\n>>> {bc}\n\n**Already pulled/picked:** {picked_so_far}\n\n*Your hand is shown below.*",
@@ -987,7 +1221,8 @@ class RoundPlayView(ui.View):
             return await interaction.response.send_message("🎩 You're the **Card Czar** — no hand to view!", ephemeral=True)
 
         player    = game.players[uid]
-        hand_file = _build_hand_image(game, player)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        hand_file = await _build_hand_image(game, player)
         embed     = discord.Embed(title="👁️ Your Hand", color=C.WHITE)
         embed.set_image(url="attachment://hand.png")
 
@@ -1006,21 +1241,26 @@ class RoundPlayView(ui.View):
             embed.add_field(name="⏳ In progress",
                             value="\n".join(f"` • ` {c}" for c in player.pending_picks), inline=False)
 
-        await interaction.response.send_message(embed=embed, file=hand_file, ephemeral=True)
+        await interaction.followup.send(embed=embed, file=hand_file, ephemeral=True)
 
 
 # ──────────── Judging ────────────
 
 class JudgingButtonView(ui.View):
-    def __init__(self, game: Game, entries: list[tuple[int, list[str]]]):
+    def __init__(self, game: Game, entries: list[tuple[int, list[str]]], round_number: int):
         super().__init__(timeout=None)
-        self.game    = game
-        self.entries = entries
-        self.done    = False
+        self.game         = game
+        self.entries      = entries
+        self.round_number = round_number
+        self.done         = False
+
+    def is_current(self) -> bool:
+        return (not self.done and self.game.phase == Phase.JUDGING
+                and self.game.round_number == self.round_number)
 
     @ui.button(label="Pick the Winner", style=discord.ButtonStyle.blurple, emoji="🎩")
     async def pick_btn(self, interaction: discord.Interaction, button: ui.Button):
-        if self.done:
+        if not self.is_current():
             return await interaction.response.send_message("Winner already picked!", ephemeral=True)
         if interaction.user.id != self.game.czar_id:
             return await interaction.response.send_message("Only the **Card Czar** can pick the winner!", ephemeral=True)
@@ -1060,42 +1300,53 @@ class CzarPickDropdown(ui.View):
         self.add_item(sel)
 
     async def on_pick(self, interaction: discord.Interaction):
-        if self.done:
+        # The czar may have opened several dropdowns, or kept one from a skipped round
+        if self.done or not self.parent_view.is_current():
             return await interaction.response.send_message("Already picked!", ephemeral=True)
 
         choice       = int(interaction.data["values"][0])
         winner       = self.game.pick_winner(choice)
         self.done    = True
+        self.parent_view.done = True
         self.stop()
 
         winning_cards = self.game.submissions[winner.id]
         filled        = fmt_black(self.game.black_card, winning_cards)
 
-        # Fetch the winner's avatar for the winner card
-        winner_avatar = await fetch_avatar_bytes(winner.member)
-
-        winner_img = render_winner(
-            self.game.black_card["text"], winning_cards,
-            pack_id=self.game.black_card.get("pack_id", ""),
-            pack_name=self.game.black_card.get("pack_name", ""),
-            avatar_bytes=winner_avatar)
-        card_file = discord.File(winner_img, filename="winner.png")
-
-        await interaction.response.edit_message(
+        # Use the reveal rendered during judging; the other candidates' are dropped
+        renders = self.game._winner_renders
+        self.game._winner_renders = {}
+        render  = renders.pop(winner.id, None)
+        for task in renders.values():
+            task.cancel()
+        if render is None:
+            render = _render_winner_for(self.game.black_card, winner, winning_cards)
+
+        # Confirm to the czar in the background; the reveal only waits on the render
+        confirm = asyncio.create_task(interaction.response.edit_message(
             embed=discord.Embed(
                 title="✅ Winner Selected!",
                 description=f"You picked **{winner.name}**'s answer.\nRevealing to the channel...",
                 color=C.GREEN),
-            view=None)
+            view=None))
+        try:
+            winner_img = await render
+        except Exception as e:
+            # Reveal in text rather than leave the round stuck in judging
+            print(f"ERROR rendering winner card for {winner.name}: {e}")
+            winner_img = None
 
         embed = discord.Embed(title="🏆 Round Winner!", color=C.GOLD)
-        embed.set_image(url="attachment://winner.png")
+        files = []
+        if winner_img is not None:
+            files.append(discord.File(winner_img, filename="winner.png"))
+            embed.set_image(url="attachment://winner.png")
         embed.add_field(name=f"🎉 {winner.name} wins this round!", value=f"\n>>> {filled}", inline=False)
         embed.add_field(name="Score",
                         value=f"**{winner.name}** now has **{winner.score}** point{'s' if winner.score != 1 else ''}",
                         inline=False)
-        embed.add_field(name="Scoreboard", value=fmt_scores(self.game.players, compact=True), inline=False)
-        await self.game.channel.send(embed=embed, file=card_file)
+        embed.add_field(name="Scoreboard", value=fmt_scores(self.game, compact=True), inline=False)
+        await asyncio.gather(self.game.channel.send(embed=embed, files=files), confirm)
 
         game_winner = self.game.check_game_over()
         if game_winner:
@@ -1103,43 +1354,63 @@ class CzarPickDropdown(ui.View):
             self.game.record_recent()
             await self.game.channel.send(embed=discord.Embed(
                 title="🎊  GAME OVER  🎊",
-                description=f"# 🏆 {game_winner.name} wins!\n\nwith **{game_winner.score}** points\n\n**Final Scores:**\n{fmt_scores(self.game.players)}",
+                description=f"# 🏆 {game_winner.name} wins!\n\nwith **{game_winner.score}** points\n\n**Final Scores:**\n{fmt_scores(self.game)}",
                 color=C.GOLD))
-            if self.game.channel.id in active_games:
-                del active_games[self.game.channel.id]
+            end_game(self.game)
             return
 
         if self.game.mode == GameMode.ADHOC:
             self.game.record_recent()
             await self.game.channel.send(embed=discord.Embed(
                 title="✅ Quick Round Complete!",
-                description=f"Thanks for playing!\n\n{fmt_scores(self.game.players)}",
+                description=f"Thanks for playing!\n\n{fmt_scores(self.game)}",
                 color=C.BLUE))
-            self.game.phase = Phase.FINISHED
-            if self.game.channel.id in active_games:
-                del active_games[self.game.channel.id]
+            end_game(self.game)
             return
 
         self.game.advance_czar()
-        await asyncio.sleep(3)
+        round_number, phase = self.game.round_number, self.game.phase
+        await asyncio.sleep(NEXT_ROUND_DELAY)
+        # A skip, a czar leaving or the host ending the game during the pause
+        # has already moved on; starting another round here would deal twice
+        if self.game.round_number != round_number or self.game.phase != phase:
+            return
         await start_round(self.game)
 
 
 # ── Round Flow ───────────────────────────────────────────────────────────────
 
+def end_game(game: Game):
+    """Mark a game finished, drop it from active_games and release its cards."""
+    game.phase = Phase.FINISHED
+    if game.round_view:
+        game.round_view.stop()
+    # Stop background renders and status edits; nothing reads them after this
+    for task in (game._status_task, game._prerender_task, *game._winner_renders.values()):
+        if task is not None:
+            task.cancel()
+    game._status_task = game._prerender_task = None
+    game._winner_renders = {}
+    if active_games.get(game.channel.id) is game:
+        del active_games[game.channel.id]
+    game.submissions.clear()
+    for p in game.players.values():
+        p.hand.clear()
+        p.pending_picks.clear()
+
+
 async def start_round(game: Game):
     black = game.start_round()
     czar  = game.czar
-    non_czar = [game.players[pid].name for pid in game.players if pid != game.czar_id]
+    czar_id  = game.czar_id
+    non_czar = [name for pid, name in game.names.items() if pid != czar_id]
 
-    # Fetch the czar's avatar for the black card image
-    czar_avatar = await fetch_avatar_bytes(czar.member)
+    # Let a speculative render of this card finish so we read it from the cache
+    # (wait rather than await: end_game may cancel it meanwhile)
+    if game._prerender_task is not None and not game._prerender_task.done():
+        await asyncio.wait([game._prerender_task])
 
-    card_img  = render_black_card(
-        black["text"], black["pick"],
-        pack_id=black.get("pack_id", ""),
-        pack_name=black.get("pack_name", ""),
-        avatar_bytes=czar_avatar)
+    card_img  = await _render_black_for(black, czar)
     card_file = discord.File(card_img, filename="black_card.png")
 
     embed = discord.Embed(title=f"━━━━ Round {game.round_number} ━━━━", color=C.BLACK)
@@ -1153,19 +1424,75 @@ async def start_round(game: Game):
     game.round_view = view
     msg            = await game.channel.send(embed=embed, file=card_file, view=view)
     game._round_msg = msg
+    game._prerender_task = asyncio.create_task(_prerender_next_black(game))
+
+
+async def _render_black_for(black: BlackCard, czar: Player) -> io.BytesIO:
+    # Fetch the czar's avatar for the black card image
+    czar_avatar = await fetch_avatar_bytes(czar.member)
+    return await render_cached(
+        "render_black_card",
+        black.text, black.pick,
+        pack_id=black.pack_id,
+        pack_name=black.pack_name,
+        avatar_bytes=czar_avatar)
+
+
+async def _prerender_next_black(game: Game):
+    """Render the next round's black card into the cache while this round plays.
+
+    The image carries the czar's avatar, so only the top of the pile paired with
+    the next czar in rotation can be prepared ahead; a leave or skip just means
+    a cache miss next round.
+    """
+    if not game.deck.black_draw or not game.czar_order:
+        return
+    black = game.deck.black_draw[-1]
+    czar  = game.players.get(game.czar_order[(game.czar_index + 1) % len(game.czar_order)])
+    if czar is None:
+        return
+    try:
+        await _render_black_for(black, czar)
+    except Exception as e:
+        print(f"Black card prerender failed: {e}")
+
+
+def schedule_round_status(game: Game):
+    """Queue a round-status edit; a burst of submissions collapses into one edit."""
+    game._status_dirty = True
+    if game._status_task is None or game._status_task.done():
+        game._status_task = asyncio.create_task(_flush_round_status(game))
+
+
+async def _flush_round_status(game: Game):
+    while game._status_dirty:
+        await asyncio.sleep(STATUS_DEBOUNCE)
+        game._status_dirty = False
+        try:
+            await update_round_status(game)
+        except discord.HTTPException as e:
+            # Stay dirty and forget the signature so the next schedule retries the edit
+            print(f"WARNING: Round status edit failed: {e}")
+            game._status_dirty = True
+            game._status_sig   = None
+            return
 
 
 async def update_round_status(game: Game):
-    msg = getattr(game, "_round_msg", None)
+    msg = game._round_msg
     if not msg:
         return
 
     black        = game.black_card
     czar         = game.czar
     done         = submitted_names(game)
-    still_waiting = [game.players[pid].name for pid in game.players
-                     if pid != game.czar_id and pid not in game.submissions]
-    in_prog      = in_progress_names(game)
+    still_waiting, in_prog = waiting_names(game)
+
+    # A debounced flush can land after nothing visible changed; skip the PATCH
+    sig = (msg.id, game.czar_id, tuple(done), tuple(in_prog), tuple(still_waiting))
+    if sig == game._status_sig:
+        return
+    game._status_sig = sig
 
     embed = discord.Embed(title=f"━━━━ Round {game.round_number} ━━━━", color=C.BLACK)
     embed.add_field(name="⬛ Black Card", value=f">>> {fmt_black(black)}", inline=False)
@@ -1186,19 +1513,28 @@ async def update_round_status(game: Game):
 
 
 async def begin_judging_phase(game: Game):
+    # Two last submissions can both see all_submitted() after their awaits;
+    # only the first one through flips the phase and posts the judging view.
+    if game.phase != Phase.PLAYING:
+        return
     entries = game.begin_judging()
+    rn      = game.round_number
     if game.round_view:
         game.round_view.stop()
 
     submission_cards = [cards for _, cards in entries]
 
-    judging_img = render_judging(
-        game.black_card["text"], game.black_card["pick"],
+    judging_img = await render_cached(
+        "render_judging",
+        game.black_card.text, game.black_card.pick,
         submission_cards, numbers=True,
-        black_pack_id=game.black_card.get("pack_id", ""),
-        black_pack_name=game.black_card.get("pack_name", ""),
+        black_pack_id=game.black_card.pack_id,
+        black_pack_name=game.black_card.pack_name,
         white_pack_ids=[[game.white_pack_ids.get(c, "")   for c in cards] for cards in submission_cards],
-        white_pack_names=[[game.white_pack_names.get(c, "") for c in cards] for cards in submission_cards])
+        white_pack_names=[[game.white_pack_name(c)          for c in cards] for cards in submission_cards])
+    # A skip or the czar leaving during the render has already moved on
+    if game.phase != Phase.JUDGING or game.round_number != rn:
+        return
     card_file = discord.File(judging_img, filename="judging.png")
 
     # ── Black card shown ABOVE the white submissions ──
@@ -1207,24 +1543,40 @@ async def begin_judging_phase(game: Game):
     embed.add_field(name="⬛ Black Card", value=f">>> {bc_text}", inline=False)
     embed.set_image(url="attachment://judging.png")
 
-    subs_text = ""
-    for i, (pid, cards) in enumerate(entries, 1):
-        subs_text += f"**` {i} `** {' **┃** '.join(cards)}\n"
+    subs_text = "".join(f"**` {i} `** {' **┃** '.join(cards)}\n" for i, (_, cards) in enumerate(entries, 1))
 
     embed.add_field(name="📋 Submissions", value=subs_text, inline=False)
     embed.add_field(name="🎩 Czar",
                     value=f"{game.czar.member.mention} — click the button to pick the winner!",
                     inline=False)
 
-    view = JudgingButtonView(game, entries)
+    view = JudgingButtonView(game, entries, rn)
     await game.channel.send(embed=embed, file=card_file, view=view)
+    # Same check after the send: abort_round has already cleared this round's renders
+    if game.phase != Phase.JUDGING or game.round_number != rn:
+        return
+
+    # Only these players can win, so render every reveal while the czar reads
+    black = game.black_card
+    game._winner_renders = {
+        pid: asyncio.create_task(_render_winner_for(black, game.players[pid], cards))
+        for pid, cards in entries if pid in game.players}
+
+
+async def _render_winner_for(black: BlackCard, winner: Player, cards: list[str]) -> io.BytesIO:
+    winner_avatar = await fetch_avatar_bytes(winner.member)
+    return await render_cached(
+        "render_winner",
+        black.text, cards,
+        pack_id=black.pack_id,
+        pack_name=black.pack_name,
+        avatar_bytes=winner_avatar)
 
 
 # ── Bot Setup ────────────────────────────────────────────────────────────────
 
 intents               = discord.Intents.default()
 intents.message_content = True
-intents.members       = True
 
 bot          = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents, help_command=None)
 active_games: dict[int, Game] = {}
@@ -1235,12 +1587,27 @@ cards_db     = CardDB(CARDS_FILE)
 async def on_ready():
     print(f"✅  {bot.user} online | {cards_db.total_white}⬜ {cards_db.total_black}⬛ across {len(cards_db.pack_ids)} packs")
     await bot.change_presence(activity=discord.Game(name="Cards Against Humanity | !cah help"))
+    if not reap_idle_games.is_running():
+        reap_idle_games.start()
+
+
+@tasks.loop(seconds=60)
+async def reap_idle_games():
+    """End games nobody has touched in GAME_IDLE_TIMEOUT (abandoned lobbies, AFK tables)."""
+    now  = time.monotonic()
+    idle = [g for g in active_games.values() if now - g.last_activity > GAME_IDLE_TIMEOUT]
+    for game in idle:
+        game.record_recent()
+        end_game(game)
+        try:
+            await game.channel.send("💤 Game ended after an hour of inactivity.")
+        except discord.HTTPException:
+            pass
 
 
 # ── Commands ─────────────────────────────────────────────────────────────────
 
-@bot.command(name="help")
-async def cah_help(ctx: commands.Context):
+def _build_help_embed() -> discord.Embed:
     embed = discord.Embed(title="🃏 Cards Against Humanity", description="*A horrible card game for horrible people.*", color=C.BLACK)
     embed.add_field(name="🎮 Starting", inline=False, value=(
         "`!cah start [score]` — Full game (default: first to 7)\n"
@@ -1264,7 +1631,16 @@ async def cah_help(ctx: commands.Context):
         "`!cah end` — *(Host)* End game\n"
         "`!cah cards` — Card database stats"))
     embed.set_footer(text=f"Min {MIN_PLAYERS} players • Everything is in-channel, no DMs needed!")
-    await ctx.send(embed=embed)
+    return embed
+
+
+# The help text never changes, so build it once and resend the same embed
+HELP_EMBED = _build_help_embed()
+
+
+@bot.command(name="help")
+async def cah_help(ctx: commands.Context):
+    await ctx.send(embed=HELP_EMBED)
 
 
 @bot.command(name="cards")
@@ -1319,14 +1695,13 @@ async def cah_status(ctx: commands.Context):
         embed.add_field(name="🎩 Czar",  value=game.czar.name,       inline=True)
     embed.add_field(name="Players", value=str(len(game.players)),  inline=True)
     if game.black_card and game.phase in (Phase.PLAYING, Phase.JUDGING):
-        embed.add_field(name="⬛ Black Card", value=game.black_card["text"], inline=False)
+        embed.add_field(name="⬛ Black Card", value=game.black_card.text, inline=False)
     if game.phase == Phase.PLAYING:
-        done    = submitted_names(game)
-        waiting = [game.players[pid].name for pid in game.players
-                   if pid != game.czar_id and pid not in game.submissions]
+        done       = submitted_names(game)
+        waiting, _ = waiting_names(game)
         embed.add_field(name="✅ Submitted", value=", ".join(done)    or "None",    inline=True)
         embed.add_field(name="⏳ Waiting",   value=", ".join(waiting) or "Nobody!", inline=True)
-    embed.add_field(name="Scoreboard", value=fmt_scores(game.players), inline=False)
+    embed.add_field(name="Scoreboard", value=fmt_scores(game), inline=False)
     await ctx.send(embed=embed)
 
 
@@ -1340,14 +1715,7 @@ async def cah_skip(ctx: commands.Context):
     if game.phase not in (Phase.PLAYING, Phase.JUDGING):
         return await ctx.send("Nothing to skip.")
     old_czar = game.czar.name if game.czar else "Unknown"
-    for pid, cards in game.submissions.items():
-        if pid in game.players:
-            game.players[pid].hand.extend(cards)
-    game.submissions.clear()
-    for pid in game.players:
-        game.cancel_pending(pid)
-    if game.black_card:
-        game.deck.discard_black(game.black_card)
+    game.abort_round()
     if game.round_view:
         game.round_view.stop()
     game.advance_czar()
@@ -1355,6 +1723,29 @@ async def cah_skip(ctx: commands.Context):
     await start_round(game)
 
 
+async def _after_player_gone(ctx: commands.Context, game: Game, was_czar: bool,
+                             gone_msg: str, czar_gone_msg: str):
+    """Shared tail of remove/leave: end the game, restart the round, or move on to judging.
+
+    The departure notice rides along with any follow-up line so the channel
+    gets one message instead of two back-to-back sends."""
+    if len(game.players) < MIN_PLAYERS:
+        await ctx.send(f"{gone_msg}\n⚠️ Not enough players. Game over!")
+        game.record_recent()
+        end_game(game)
+        return
+    if was_czar and game.phase in (Phase.PLAYING, Phase.JUDGING):
+        await ctx.send(f"{gone_msg}\n{czar_gone_msg}")
+        game.abort_round()
+        if game.round_view:
+            game.round_view.stop()
+        await start_round(game)
+    else:
+        await ctx.send(gone_msg)
+        if game.phase == Phase.PLAYING and game.all_submitted():
+            await begin_judging_phase(game)
+
+
 @bot.command(name="remove")
 async def cah_remove(ctx: commands.Context, member: discord.Member = None):
     game = active_games.get(ctx.channel.id)
@@ -1366,26 +1757,8 @@ async def cah_remove(ctx: commands.Context, member: discord.Member = None):
         return await ctx.send("Usage: `!cah remove @player`")
     was_czar = (member.id == game.czar_id)
     removed  = game.remove_player(member.id)
-    await ctx.send(f"🚪 **{removed.name}** removed from the game.")
-    if len(game.players) < MIN_PLAYERS:
-        await ctx.send("⚠️ Not enough players. Game over!")
-        game.phase = Phase.FINISHED
-        game.record_recent()
-        del active_games[ctx.channel.id]
-        return
-    if was_czar and game.phase in (Phase.PLAYING, Phase.JUDGING):
-        await ctx.send("Czar was removed — restarting round...")
-        for pid, cards in game.submissions.items():
-            if pid in game.players:
-                game.players[pid].hand.extend(cards)
-        game.submissions.clear()
-        if game.black_card:
-            game.deck.discard_black(game.black_card)
-        if game.round_view:
-            game.round_view.stop()
-        await start_round(game)
-    elif game.phase == Phase.PLAYING and game.all_submitted():
-        await begin_judging_phase(game)
+    await _after_player_gone(ctx, game, was_czar, f"🚪 **{removed.name}** removed from the game.",
+                             "Czar was removed — restarting round...")
 
 
 @bot.command(name="leave")
@@ -1394,27 +1767,9 @@ async def cah_leave(ctx: commands.Context):
     if not game or ctx.author.id not in game.players:
         return await ctx.send("You're not in a game here.")
     was_czar = (ctx.author.id == game.czar_id)
-    game.remove_player(ctx.author.id)
-    await ctx.send(f"👋 **{ctx.author.display_name}** left the game.")
-    if len(game.players) < MIN_PLAYERS:
-        await ctx.send("⚠️ Not enough players. Game over!")
-        game.phase = Phase.FINISHED
-        game.record_recent()
-        del active_games[ctx.channel.id]
-        return
-    if was_czar and game.phase in (Phase.PLAYING, Phase.JUDGING):
-        await ctx.send("Czar left — restarting round...")
-        for pid, cards in game.submissions.items():
-            if pid in game.players:
-                game.players[pid].hand.extend(cards)
-        game.submissions.clear()
-        if game.black_card:
-            game.deck.discard_black(game.black_card)
-        if game.round_view:
-            game.round_view.stop()
-        await start_round(game)
-    elif game.phase == Phase.PLAYING and game.all_submitted():
-        await begin_judging_phase(game)
+    left     = game.remove_player(ctx.author.id)
+    await _after_player_gone(ctx, game, was_czar, f"👋 **{left.name}** left the game.",
+                             "Czar left — restarting round...")
 
 
 @bot.command(name="end")
@@ -1424,33 +1779,26 @@ async def cah_end(ctx: commands.Context):
         return await ctx.send("No active game.")
     if ctx.author.id != game.host.id:
         return await ctx.send("Only the host can end the game.")
-    if game.round_view:
-        game.round_view.stop()
     game.record_recent()
+    end_game(game)
     await ctx.send(embed=discord.Embed(
         title="🛑 Game Ended",
-        description=f"**{ctx.author.display_name}** ended the game.\n\n**Final Scores:**\n{fmt_scores(game.players)}",
+        description=f"**{ctx.author.display_name}** ended the game.\n\n**Final Scores:**\n{fmt_scores(game)}",
         color=C.RED))
-    game.phase = Phase.FINISHED
-    del active_games[ctx.channel.id]
 
 
 @bot.command(name="drawtest")
 async def cah_drawtest(ctx: commands.Context):
     """Hidden test command — draws one random white and one random black card."""
     all_whites:     list[str]  = []
-    all_blacks:     list[dict] = []
+    all_blacks:     list[BlackCard] = []
     wpid_map:  dict[str, str]  = {}
-    wpname_map: dict[str, str] = {}
 
     for pid, pack in cards_db.packs.items():
-        pack_name = pack["name"]
         for w in pack["white"]:
             all_whites.append(w)
-            wpid_map[w]   = pid
-            wpname_map[w] = pack_name
-        for b in pack["black"]:
-            all_blacks.append({**b, "pack_id": pid, "pack_name": pack_name})
+            wpid_map[w] = pid
+        all_blacks.extend(pack["black"])
 
     white = random.choice(all_whites)
     black = random.choice(all_blacks)
@@ -1458,30 +1806,32 @@ async def cah_drawtest(ctx: commands.Context):
     # Fetch command author's avatar for the test render
     test_avatar = await fetch_avatar_bytes(ctx.author)
 
-    black_img  = render_black_card(
-        black["text"], black["pick"],
-        pack_id=black.get("pack_id", ""),
-        pack_name=black.get("pack_name", ""),
-        avatar_bytes=test_avatar)
-    black_file = discord.File(black_img, filename="black_card.png")
-
-    white_img  = render_hand(
-        [white],
-        white_pack_ids={white: wpid_map.get(white, "")},
-        white_pack_names={white: wpname_map.get(white, "")})
-    white_file = discord.File(white_img, filename="hand.png")
-
-    winner_img = render_winner(
-        black["text"], [white],
-        pack_id=black.get("pack_id", ""),
-        pack_name=black.get("pack_name", ""),
-        avatar_bytes=test_avatar)
+    black_img, white_img, winner_img = await asyncio.gather(
+        render_async(
+            "render_black_card",
+            black.text, black.pick,
+            pack_id=black.pack_id,
+            pack_name=black.pack_name,
+            avatar_bytes=test_avatar),
+        render_async(
+            "render_hand",
+            [white],
+            white_pack_ids={white: wpid_map.get(white, "")},
+            white_pack_names={white: cards_db.packs[wpid_map[white]]["name"]}),
+        render_async(
+            "render_winner",
+            black.text, [white],
+            pack_id=black.pack_id,
+            pack_name=black.pack_name,
+            avatar_bytes=test_avatar))
+    black_file  = discord.File(black_img, filename="black_card.png")
+    white_file  = discord.File(white_img, filename="hand.png")
     winner_file = discord.File(winner_img, filename="winner.png")
 
     await ctx.send(
         embed=discord.Embed(
             title="🧪 Draw Test",
-            description=f"⬛ **Black:** {black['text']}\n\n⬜ **White:** {white}\n\n🏆 **Winner:** {fmt_black(black, [white])}",
+            description=f"⬛ **Black:** {black.text}\n\n⬜ **White:** {white}\n\n🏆 **Winner:** {fmt_black(black, [white])}",
             color=C.DARK),
         files=[black_file, white_file, winner_file])
 
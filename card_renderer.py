@@ -12,10 +12,14 @@ Pack logos:
   directory as this script. The white variant is used on black cards and vice versa.
   Recommended source resolution: 400px tall at whatever width your logo needs.
   If no image is found, the pack name falls back to plain text.
+
+Every canvas is RGB from start to PNG. Alpha only appears in paste masks:
+pack logos and avatars, and the L masks used to stamp footer text, number
+badges and the dimmed-card tint.
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageOps
-import io, os
+import functools, io, os
 
 # ── Font Setup ───────────────────────────────────────────────────────────────
 
@@ -126,6 +130,9 @@ FOOTER_RESERVED = FOOTER_PAD_BOTTOM + FOOTER_H
 
 LOGO_TEXT = "Cards Against the Wasteland"
 
+PNG_COMPRESS_LEVEL = 1   # zlib level for rendered PNGs (1 = fastest)
+JUDGING_MAX_W      = 5000  # wider judging grids are shrunk by a whole factor
+
 # ── Avatar Constants ─────────────────────────────────────────────────────────
 
 AVATAR_SIZE          = 120   # diameter on full-size cards
@@ -161,7 +168,9 @@ HAND_FOOTER_RESERVED = HAND_FOOTER_PAD_BOTTOM + HAND_FOOTER_H
 
 # ── Font Loading ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=32)
 def _load_font(path, size: int):
+    # Only a handful of (path, size) pairs are ever used; parse each TTF once
     if path and os.path.exists(path):
         try:
             return ImageFont.truetype(path, size)
@@ -211,12 +220,13 @@ def _load_pack_logo(pack_id: str, is_black: bool) -> Image.Image | None:
         return None
 
 
-def _paste_logo(canvas: Image.Image, pack_id: str,
-                x: int, y: int, target_h: int, max_w: int,
-                is_black: bool = False):
+@functools.lru_cache(maxsize=256)
+def _scaled_logo(pack_id: str, is_black: bool, target_h: int, max_w: int) -> Image.Image | None:
+    # Each card size asks for the same footer box every time, so every logo
+    # is resampled once per (pack, variant, box) rather than once per card
     logo = _load_pack_logo(pack_id, is_black)
     if logo is None:
-        return 0
+        return None
 
     orig_w, orig_h = logo.size
     scale = target_h / orig_h
@@ -226,12 +236,20 @@ def _paste_logo(canvas: Image.Image, pack_id: str,
         new_w = max_w
         target_h = int(orig_h * scale)
 
-    logo_scaled = logo.resize((new_w, target_h), Image.LANCZOS)
+    return logo.resize((new_w, target_h), Image.LANCZOS)
+
+
+def _paste_logo(canvas: Image.Image, pack_id: str,
+                x: int, y: int, target_h: int, max_w: int,
+                is_black: bool = False):
+    logo_scaled = _scaled_logo(pack_id, is_black, target_h, max_w)
+    if logo_scaled is None:
+        return 0
 
-    canvas_rgba = canvas.convert("RGBA")
-    canvas_rgba.paste(logo_scaled, (x, y), logo_scaled)
-    canvas.paste(canvas_rgba.convert("RGB"), (0, 0))
-    return new_w
+    # The logo's own alpha is the paste mask, so it blends straight onto the
+    # RGB canvas without round-tripping the whole image through RGBA
+    canvas.paste(logo_scaled, (x, y), logo_scaled)
+    return logo_scaled.width
 
 
 # ── Avatar Helper ─────────────────────────────────────────────────────────────
@@ -256,50 +274,85 @@ def _paste_circular_avatar(canvas: Image.Image, avatar_bytes: bytes,
     (cx, cy) is the top-left of the total bounding box (border included).
     """
     total = size + border * 2
-    canvas_rgba = canvas.convert("RGBA")
 
-    # Border ring
-    ring = Image.new("RGBA", (total, total), (0, 0, 0, 0))
-    ImageDraw.Draw(ring).ellipse((0, 0, total - 1, total - 1), fill=border_color)
-    canvas_rgba.paste(ring, (cx, cy), ring)
+    # Border ring: a solid disc, so it can be drawn in place
+    ImageDraw.Draw(canvas).ellipse((cx, cy, cx + total - 1, cy + total - 1), fill=border_color)
 
-    # Avatar
+    # Avatar, masked by its own circular alpha
     av = _make_circular_avatar(avatar_bytes, size)
-    canvas_rgba.paste(av, (cx + border, cy + border), av)
-
-    canvas.paste(canvas_rgba.convert("RGB"), (0, 0))
+    canvas.paste(av, (cx + border, cy + border), av)
 
 
 # ── Text Wrapping ────────────────────────────────────────────────────────────
 
-def _wrap_text(text: str, font, max_width: int) -> list[str]:
-    words = text.split()
+# Bounded: pool workers live for the whole bot session and wild-card answers
+# keep adding new words
+@functools.lru_cache(maxsize=16384)
+def _advance(font, s: str) -> float:
+    """font.getlength(s), memoized per (font, s); card vocabulary repeats heavily."""
+    return font.getlength(s)
+
+
+def _fits(font, s: str, est: float, max_width: int) -> bool:
+    """Whether s's ink width (its getbbox span) is within max_width.
+
+    ``est`` is a summed-advance estimate of that width. It only differs from the
+    bbox by side bearings and kerning, so anything more than an em away from
+    the limit is decided without shaping s.
+    """
+    slack = getattr(font, "size", max_width)
+    if est <= max_width - slack:
+        return True
+    if est > max_width + slack:
+        return False
+    left, _, right, _ = font.getbbox(s)
+    return right - left <= max_width
+
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_text(text: str, font, max_width: int) -> tuple[str, ...]:
+    # Keep a running line width from memoized word advances, so only lines
+    # close to the limit are re-measured with getbbox. Fonts come from
+    # _load_font's cache, so the same card text wraps once per worker.
+    space_w = _advance(font, " ")
     lines = []
     current_line = ""
-    for word in words:
-        test = f"{current_line} {word}".strip()
-        w = font.getbbox(test)[2] - font.getbbox(test)[0]
-        if w <= max_width:
+    current_w = 0.0
+    for word in text.split():
+        word_w = _advance(font, word)
+        test = f"{current_line} {word}" if current_line else word
+        test_w = current_w + space_w + word_w if current_line else word_w
+        if _fits(font, test, test_w, max_width):
             current_line = test
+            current_w = test_w
         else:
             if current_line:
                 lines.append(current_line)
-            bw = font.getbbox(word)[2] - font.getbbox(word)[0]
-            if bw > max_width:
-                partial = ""
+            if not _fits(font, word, word_w, max_width):
+                # Hard-break an overlong word, measuring each character once
+                partial, partial_w = "", 0.0
                 for ch in word:
-                    test_ch = partial + ch
-                    if font.getbbox(test_ch)[2] - font.getbbox(test_ch)[0] > max_width and partial:
+                    ch_w = _advance(font, ch)
+                    if partial and not _fits(font, partial + ch, partial_w + ch_w, max_width):
                         lines.append(partial)
-                        partial = ch
+                        partial, partial_w = ch, ch_w
                     else:
-                        partial = test_ch
+                        partial += ch
+                        partial_w += ch_w
                 current_line = partial
             else:
                 current_line = word
+            current_w = _advance(font, current_line)
     if current_line:
         lines.append(current_line)
-    return lines if lines else [""]
+    return tuple(lines) if lines else ("",)
+
+
+@functools.lru_cache(maxsize=32)
+def _line_metrics(font) -> tuple[int, int]:
+    """(line height, top-to-baseline of "A") for a font; the latter is the step multiline_text uses."""
+    bbox = font.getbbox("Ag")
+    return bbox[3] - bbox[1], font.getbbox("A")[3]
 
 
 # ── Drawing Primitives ───────────────────────────────────────────────────────
@@ -308,17 +361,36 @@ def _rounded_rect(draw, xy, radius, fill):
     draw.rounded_rectangle(xy, radius=radius, fill=fill)
 
 
+# Shadows only ever land on the plain table, so blend SHADOW_COLOR over
+# BG_COLOR once and paint that instead of compositing a full-canvas overlay.
+SHADOW_FILL = Image.alpha_composite(
+    Image.new("RGBA", (1, 1), BG_COLOR + (255,)),
+    Image.new("RGBA", (1, 1), SHADOW_COLOR)).getpixel((0, 0))[:3]
+
 def _draw_shadow(img, x, y, w, h, corner_r=None, offset=4):
     if corner_r is None:
         corner_r = CORNER_R
-    overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-    ImageDraw.Draw(overlay).rounded_rectangle(
+    ImageDraw.Draw(img).rounded_rectangle(
         (x + offset, y + offset, x + w + offset, y + h + offset),
-        radius=corner_r, fill=SHADOW_COLOR)
-    img.paste(Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB"), (0, 0))
+        radius=corner_r, fill=SHADOW_FILL)
+
+
+def _draw_text_block(draw, x, y, lines, font, fill, gap, bottom):
+    """
+    Draw wrapped lines in one multiline_text call, ``gap`` px apart.
+    Lines that would cross ``bottom`` are cut and replaced by "...".
+    """
+    line_h, a_h = _line_metrics(font)
+    pitch  = line_h + gap
+    fits   = max(0, (bottom - y - line_h) // pitch + 1)
+    if fits < len(lines):
+        lines = lines[:fits] + ("...",)
+    # multiline_text steps by the height of "A" plus spacing; match our pitch
+    spacing = pitch - a_h
+    draw.multiline_text((x, y), "\n".join(lines), fill=fill, font=font, spacing=spacing)
 
 
-def _draw_footer(img, draw, x, y,
+def _draw_footer(img, x, y,
                  card_w, card_h, footer_pad_left, footer_pad_bottom,
                  footer_h, logo_font_size, pack_font_size, gap,
                  is_black, pack_id, pack_name):
@@ -335,125 +407,235 @@ def _draw_footer(img, draw, x, y,
             target_h=footer_h,
             max_w=max_footer_w // 2,
             is_black=is_black)
-        draw = ImageDraw.Draw(img)
 
+    mask = _footer_text_mask(card_w - footer_pad_left, footer_h + footer_pad_bottom,
+                             footer_h, max_footer_w, logo_font_size, pack_font_size,
+                             logo_w, None if logo_w > 0 else pack_name)
+    img.paste(logo_col, (x + footer_pad_left, footer_y), mask)
+
+
+@functools.lru_cache(maxsize=256)
+def _footer_text_mask(w, h, footer_h, max_footer_w, logo_font_size, pack_font_size,
+                      logo_w, pack_name):
+    """
+    Coverage mask of the footer text, relative to the footer's top-left.
+    The footer only changes with the pack, so its text is laid out (and the
+    pack name truncated) once per pack and card size, then stamped in colour.
+    """
+    mask = Image.new("L", (w, h), 0)
+    draw = ImageDraw.Draw(mask)
     logo_font = _load_font(FONT_REG_PATH, logo_font_size)
 
     if logo_w > 0:
-        text_x = x + footer_pad_left + logo_w + 8
-        text_h = logo_font.getbbox(LOGO_TEXT)[3] - logo_font.getbbox(LOGO_TEXT)[1]
-        text_y = footer_y + (footer_h - text_h) // 2
-        draw.text((text_x, text_y), LOGO_TEXT, fill=logo_col, font=logo_font)
+        _, top, _, bottom = logo_font.getbbox(LOGO_TEXT)
+        text_h = bottom - top
+        draw.text((logo_w + 8, (footer_h - text_h) // 2), LOGO_TEXT, fill=255, font=logo_font)
     else:
-        draw.text((x + footer_pad_left, footer_y), LOGO_TEXT, fill=logo_col, font=logo_font)
+        draw.text((0, 0), LOGO_TEXT, fill=255, font=logo_font)
         if pack_name:
             pack_font = _load_font(FONT_REG_PATH, pack_font_size)
-            pack_y = y + card_h - footer_pad_bottom - pack_font_size
-            pack_line = pack_name
-            while (pack_font.getbbox(pack_line)[2] - pack_font.getbbox(pack_line)[0] > max_footer_w
-                   and len(pack_line) > 5):
-                pack_line = pack_line[:-2] + "…"
-            draw.text((x + footer_pad_left, pack_y), pack_line, fill=logo_col, font=pack_font)
+            pack_line = _fit_ellipsis(pack_name, pack_font, max_footer_w)
+            draw.text((0, footer_h - pack_font_size), pack_line, fill=255, font=pack_font)
+    return mask
+
+
+def _fit_ellipsis(text: str, font, max_w: int) -> str:
+    """Longest ``prefix…`` of text that fits max_w, found by bisection (never under 4 chars)."""
+    def width(t):
+        bbox = font.getbbox(t)
+        return bbox[2] - bbox[0]
+
+    if len(text) <= 5 or width(text) <= max_w:
+        return text
+    lo, hi = 4, len(text) - 2
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if width(text[:mid] + "…") <= max_w:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + "…"
+
+
+# Room a card tile leaves right of and below the card for its drop shadow
+TILE_SHADOW = 4
+
+@functools.lru_cache(maxsize=2)
+def _blank_card(is_black: bool) -> Image.Image:
+    """A full-size card body and drop shadow on the table colour, drawn once per colour."""
+    blank = Image.new("RGB", (CARD_W + TILE_SHADOW + 1, CARD_H + TILE_SHADOW + 1), BG_COLOR)
+    _draw_shadow(blank, 0, 0, CARD_W, CARD_H, corner_r=CORNER_R, offset=TILE_SHADOW)
+    _rounded_rect(ImageDraw.Draw(blank), (0, 0, CARD_W, CARD_H), CORNER_R,
+                  fill=BLACK_CARD_BG if is_black else WHITE_CARD_BG)
+    return blank
 
 
 def _draw_card(img, x, y, is_black, text,
                number=None, bold=True, pack_id=None, pack_name=None):
     """Draw a full-size card."""
-    draw = ImageDraw.Draw(img)
-    bg = BLACK_CARD_BG if is_black else WHITE_CARD_BG
     fg = BLACK_CARD_FG if is_black else WHITE_CARD_FG
 
-    _draw_shadow(img, x, y, CARD_W, CARD_H, corner_r=CORNER_R)
+    # Cards always sit on bare table, so the blank card (corners included)
+    # can be copied in whole
+    img.paste(_blank_card(is_black), (x, y))
     draw = ImageDraw.Draw(img)
-    _rounded_rect(draw, (x, y, x + CARD_W, y + CARD_H), CORNER_R, fill=bg)
 
     font = _get_card_font(text, bold=bold)
     lines = _wrap_text(text, font, TEXT_AREA_W)
-    line_h = font.getbbox("Ag")[3] - font.getbbox("Ag")[1]
+    _draw_text_block(draw, x + CARD_PAD, y + CARD_PAD, lines, font, fg,
+                     gap=10, bottom=y + CARD_H - FOOTER_RESERVED)
 
-    ty = y + CARD_PAD
-    for line in lines:
-        if ty + line_h > y + CARD_H - FOOTER_RESERVED:
-            draw.text((x + CARD_PAD, ty), "...", fill=fg, font=font)
-            break
-        draw.text((x + CARD_PAD, ty), line, fill=fg, font=font)
-        ty += line_h + 10
-
-    _draw_footer(img, draw, x, y,
+    _draw_footer(img, x, y,
                  CARD_W, CARD_H, FOOTER_PAD_LEFT, FOOTER_PAD_BOTTOM,
                  FOOTER_H, LOGO_FONT_SIZE, PACK_FONT_SIZE, 8,
                  is_black, pack_id, pack_name)
-    draw = ImageDraw.Draw(img)
 
     if number is not None:
-        num_font = _load_font(FONT_BOLD_PATH, NUMBER_FONT_SIZE)
-        num_text = str(number)
-        num_bbox = num_font.getbbox(num_text)
-        num_w = num_bbox[2] - num_bbox[0] + 24
-        num_h = num_bbox[3] - num_bbox[1] + 16
-        nr_x = x + CARD_W - num_w - 14
-        draw.rounded_rectangle(
-            (nr_x, y + 14, nr_x + num_w, y + 14 + num_h),
-            radius=num_h // 2,
-            fill=NUMBER_BG if not is_black else (80, 80, 80))
-        draw.text((nr_x + 12, y + 22), num_text, fill=NUMBER_FG, font=num_font)
+        shape, label = _badge_masks(str(number), NUMBER_FONT_SIZE, 24, 16, (12, 8))
+        nr_x = x + CARD_W - (shape.width - 1) - 14
+        img.paste(NUMBER_BG if not is_black else (80, 80, 80), (nr_x, y + 14), shape)
+        img.paste(NUMBER_FG, (nr_x, y + 14), label)
+
+
+@functools.lru_cache(maxsize=64)
+def _badge_masks(num_text: str, font_size: int, pad_w: int, pad_h: int,
+                 text_off: tuple[int, int]) -> tuple[Image.Image, Image.Image]:
+    """
+    (pill, label) coverage masks for a number badge, built once per number
+    and size. Pasting colours through them matches drawing the pill and text
+    in place, without clobbering whatever shows around the pill's ends.
+    """
+    num_font = _load_font(FONT_BOLD_PATH, font_size)
+    num_bbox = num_font.getbbox(num_text)
+    num_w = num_bbox[2] - num_bbox[0] + pad_w
+    num_h = num_bbox[3] - num_bbox[1] + pad_h
+    shape = Image.new("L", (num_w + 1, num_h + 1), 0)
+    ImageDraw.Draw(shape).rounded_rectangle((0, 0, num_w, num_h), radius=num_h // 2, fill=255)
+    label = Image.new("L", shape.size, 0)
+    ImageDraw.Draw(label).text(text_off, num_text, fill=255, font=num_font)
+    return shape, label
+
+
+# Spare canvases by size, reused across renders in the same worker process.
+# Only fixed-size canvases go back in; judging grids vary with the player
+# count and would just pin tens of MB per worker.
+_CANVAS_POOL: dict[tuple[int, int], list[Image.Image]] = {}
+CANVAS_POOL_DEPTH = 2
+
+def _acquire_canvas(w: int, h: int) -> Image.Image:
+    """A BG_COLOR canvas of the given size, recycled from the pool if possible."""
+    free = _CANVAS_POOL.get((w, h))
+    if free:
+        img = free.pop()
+        img.paste(BG_COLOR, (0, 0, w, h))
+        return img
+    return Image.new("RGB", (w, h), BG_COLOR)
+
+
+def _release_canvas(img: Image.Image):
+    free = _CANVAS_POOL.setdefault(img.size, [])
+    if len(free) < CANVAS_POOL_DEPTH:
+        free.append(img)
+
+
+def _card_tile(**card) -> Image.Image:
+    """Draw one full-size card, shadow included, on its own small canvas.
+    Hand the tile back with _release_canvas once it has been pasted."""
+    tile = _acquire_canvas(CARD_W + TILE_SHADOW + 1, CARD_H + TILE_SHADOW + 1)
+    _draw_card(tile, 0, 0, **card)
+    return tile
+
+
+# A round's prompt is drawn at round start and again in the judging grid;
+# keep the last few finished ones (~3 MB each) so the second render pastes it
+@functools.lru_cache(maxsize=4)
+def _black_tile(card_text: str, pick: int, pack_id: str, pack_name: str) -> Image.Image:
+    """A finished black prompt card on its shadow margin; paste, never draw on it."""
+    display_text = card_text.replace("_", "_____")
+    if pick > 1:
+        display_text += f"\n\nPICK {pick}"
+    tile = Image.new("RGB", (CARD_W + TILE_SHADOW + 1, CARD_H + TILE_SHADOW + 1), BG_COLOR)
+    _draw_card(tile, 0, 0, is_black=True, text=display_text, bold=True,
+               pack_id=pack_id, pack_name=pack_name)
+    return tile
 
 
-def _draw_hand_card(img, x, y, text, number,
-                    pack_id=None, pack_name=None,
-                    highlight=False, dimmed=False):
-    """Draw a scaled-down white card for the hand view."""
+# Room a blank hand card leaves around the card for the highlight ring and shadow
+HAND_BLANK_MARGIN = 6
+
+@functools.lru_cache(maxsize=2)
+def _blank_hand_card(highlight: bool) -> Image.Image:
+    """Shadow, optional gold ring and body of a hand card, drawn once per variant."""
+    m = HAND_BLANK_MARGIN
+    blank = Image.new("RGB", (HAND_CARD_W + m * 2 + 1, HAND_CARD_H + m * 2 + 1), BG_COLOR)
+    draw = ImageDraw.Draw(blank)
     if highlight:
-        _draw_shadow(img, x - 3, y - 3, HAND_CARD_W + 6, HAND_CARD_H + 6,
+        _draw_shadow(blank, m - 3, m - 3, HAND_CARD_W + 6, HAND_CARD_H + 6,
                      corner_r=HAND_CORNER_R + 2, offset=3)
-        draw = ImageDraw.Draw(img)
         draw.rounded_rectangle(
-            (x - 4, y - 4, x + HAND_CARD_W + 4, y + HAND_CARD_H + 4),
+            (m - 4, m - 4, m + HAND_CARD_W + 4, m + HAND_CARD_H + 4),
             radius=HAND_CORNER_R + 2, fill=FILLED_COLOR)
     else:
-        _draw_shadow(img, x, y, HAND_CARD_W, HAND_CARD_H,
+        _draw_shadow(blank, m, m, HAND_CARD_W, HAND_CARD_H,
                      corner_r=HAND_CORNER_R, offset=3)
-
-    draw = ImageDraw.Draw(img)
-    _rounded_rect(draw, (x, y, x + HAND_CARD_W, y + HAND_CARD_H),
+    _rounded_rect(draw, (m, m, m + HAND_CARD_W, m + HAND_CARD_H),
                   HAND_CORNER_R, fill=WHITE_CARD_BG)
+    return blank
+
+
+def _draw_hand_card(img, draw, x, y, text,
+                    pack_id=None, pack_name=None, highlight=False):
+    """Draw a scaled-down white card for the hand view, without its number badge;
+    ``draw`` is an ImageDraw on ``img``."""
+    img.paste(_blank_hand_card(highlight), (x - HAND_BLANK_MARGIN, y - HAND_BLANK_MARGIN))
 
     font = _get_hand_font(text)
     lines = _wrap_text(text, font, HAND_TEXT_AREA_W)
-    line_h = font.getbbox("Ag")[3] - font.getbbox("Ag")[1]
+    _draw_text_block(draw, x + HAND_CARD_PAD, y + HAND_CARD_PAD, lines, font, WHITE_CARD_FG,
+                     gap=4, bottom=y + HAND_CARD_H - HAND_FOOTER_RESERVED)
 
-    ty = y + HAND_CARD_PAD
-    for line in lines:
-        if ty + line_h > y + HAND_CARD_H - HAND_FOOTER_RESERVED:
-            draw.text((x + HAND_CARD_PAD, ty), "...", fill=WHITE_CARD_FG, font=font)
-            break
-        draw.text((x + HAND_CARD_PAD, ty), line, fill=WHITE_CARD_FG, font=font)
-        ty += line_h + 4
-
-    _draw_footer(img, draw, x, y,
+    _draw_footer(img, x, y,
                  HAND_CARD_W, HAND_CARD_H, HAND_FOOTER_PAD_LEFT, HAND_FOOTER_PAD_BOTTOM,
                  HAND_FOOTER_H, HAND_LOGO_FONT_SIZE, HAND_PACK_FONT_SIZE, 5,
                  is_black=False, pack_id=pack_id, pack_name=pack_name)
-    draw = ImageDraw.Draw(img)
 
+
+def _stamp_hand_badge(img, x, y, number, dimmed=False):
+    """Number a hand card drawn at (x, y), then grey it out if it was submitted."""
     # Number badge — top-left
-    num_font = _load_font(FONT_BOLD_PATH, HAND_NUMBER_FONT_SIZE)
-    num_text = str(number)
-    num_bbox = num_font.getbbox(num_text)
-    num_w = num_bbox[2] - num_bbox[0] + 10
-    num_h = num_bbox[3] - num_bbox[1] + 8
-    draw.rounded_rectangle(
-        (x + 6, y + 6, x + 6 + num_w, y + 6 + num_h),
-        radius=num_h // 2, fill=NUMBER_BG)
-    draw.text((x + 11, y + 10), num_text, fill=NUMBER_FG, font=num_font)
+    shape, label = _badge_masks(str(number), HAND_NUMBER_FONT_SIZE, 10, 8, (5, 4))
+    img.paste(NUMBER_BG, (x + 6, y + 6), shape)
+    img.paste(NUMBER_FG, (x + 6, y + 6), label)
 
     if dimmed:
-        overlay = Image.new("RGBA", img.size, (0, 0, 0, 0))
-        ImageDraw.Draw(overlay).rounded_rectangle(
-            (x, y, x + HAND_CARD_W, y + HAND_CARD_H),
-            radius=HAND_CORNER_R, fill=(0, 0, 0, 120))
-        merged = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
-        img.paste(merged)
+        # Black through a card-shaped 120/255 mask: the same blend as an
+        # alpha overlay, without leaving RGB
+        img.paste((0, 0, 0), (x, y), _hand_dim_mask())
+
+
+# Hand card bodies kept per worker, keyed on content only: the number badge
+# and dim tint are stamped per render, so a card keeps its tile when picks
+# ahead of it shift its position. ~0.8 MB per tile
+HAND_TILE_CACHE = 32
+
+@functools.lru_cache(maxsize=HAND_TILE_CACHE)
+def _hand_tile(text, pack_id, pack_name, highlight) -> Image.Image:
+    """One hand card body on its blank's table margin; paste, never draw on it."""
+    m = HAND_BLANK_MARGIN
+    tile = Image.new("RGB", (HAND_CARD_W + m * 2 + 1, HAND_CARD_H + m * 2 + 1), BG_COLOR)
+    _draw_hand_card(tile, ImageDraw.Draw(tile), m, m, text,
+                    pack_id=pack_id, pack_name=pack_name, highlight=highlight)
+    return tile
+
+
+@functools.lru_cache(maxsize=1)
+def _hand_dim_mask() -> Image.Image:
+    """Card-shaped mask that greys out a submitted hand card."""
+    mask = Image.new("L", (HAND_CARD_W + 1, HAND_CARD_H + 1), 0)
+    ImageDraw.Draw(mask).rounded_rectangle(
+        (0, 0, HAND_CARD_W, HAND_CARD_H),
+        radius=HAND_CORNER_R, fill=120)
+    return mask
 
 
 def _strip_answer_period(answer: str) -> str:
@@ -464,70 +646,55 @@ def _strip_answer_period(answer: str) -> str:
 def _draw_black_card_filled(img, x, y, card_text, answers,
                              pack_id=None, pack_name=None):
     """Draw a black card with blanks filled in gold."""
-    _draw_shadow(img, x, y, CARD_W, CARD_H, corner_r=CORNER_R)
+    img.paste(_blank_card(True), (x, y))
     draw = ImageDraw.Draw(img)
-    _rounded_rect(draw, (x, y, x + CARD_W, y + CARD_H), CORNER_R, fill=BLACK_CARD_BG)
 
     font = _get_card_font(card_text, bold=True)
 
-    has_blanks = "_" in card_text
-
-    if not has_blanks:
-        full_text = card_text + " " + " ".join(answers)
+    # Split the filled-in text into (text, is_answer) segments once
+    if "_" not in card_text:
+        segments = [(card_text, False)] + [(ans, True) for ans in answers]
+        full_text = " ".join(text for text, _ in segments)
     else:
-        full_text = card_text
-        for ans in answers:
-            full_text = full_text.replace("_", _strip_answer_period(ans), 1)
+        parts = card_text.split("_")
+        segments = [(parts[0], False)]
+        for k, part in enumerate(parts[1:]):
+            segments.append((_strip_answer_period(answers[k]), True) if k < len(answers) else ("_", False))
+            segments.append((part, False))
+        full_text = "".join(text for text, _ in segments)
 
     lines = _wrap_text(full_text, font, TEXT_AREA_W)
-    line_h = font.getbbox("Ag")[3] - font.getbbox("Ag")[1]
-
-    color_map = []
-    if not has_blanks:
-        for ch in card_text:
-            color_map.append((ch, False))
-        color_map.append((' ', False))
-        for ans in answers:
-            for ch in ans:
-                color_map.append((ch, True))
-            if ans != answers[-1]:
-                color_map.append((' ', True))
-    else:
-        temp = card_text
-        answer_texts = [_strip_answer_period(a) for a in answers]
-        i = 0
-        while i < len(temp):
-            if temp[i] == "_" and answer_texts:
-                ans = answer_texts.pop(0)
-                for ch in ans:
-                    color_map.append((ch, True))
-                i += 1
-            else:
-                color_map.append((temp[i], False))
-                i += 1
+    line_h = _line_metrics(font)[0]
+
+    # Wrapping only drops or re-inserts whitespace, so the colour of every
+    # other character can be read off in order as the lines are drawn
+    colors = iter([FILLED_COLOR if is_answer else BLACK_CARD_FG
+                   for text, is_answer in segments for ch in text if not ch.isspace()])
 
-    char_idx = 0
     ty = y + CARD_PAD
     for line in lines:
         if ty + line_h > y + CARD_H - FOOTER_RESERVED:
             draw.text((x + CARD_PAD, ty), "...", fill=BLACK_CARD_FG, font=font)
             break
-        tx = x + CARD_PAD
+        # Group the line into same-colour runs and draw each run in one call
+        runs = []
         for ch in line:
-            if char_idx < len(color_map):
-                _, is_answer = color_map[char_idx]
-                color = FILLED_COLOR if is_answer else BLACK_CARD_FG
-                char_idx += 1
+            if ch == " " and runs:
+                runs[-1][0].append(ch)
+                continue
+            color = next(colors, BLACK_CARD_FG)
+            if runs and runs[-1][1] == color:
+                runs[-1][0].append(ch)
             else:
-                color = BLACK_CARD_FG
-            draw.text((tx, ty), ch, fill=color, font=font)
-            tx += font.getbbox(ch)[2] - font.getbbox(ch)[0]
+                runs.append(([ch], color))
+        tx = x + CARD_PAD
+        for chars, color in runs:
+            run = "".join(chars)
+            draw.text((tx, ty), run, fill=color, font=font)
+            tx += font.getlength(run)
         ty += line_h + 10
-        if char_idx < len(color_map) and line:
-            if color_map[char_idx][0] == " ":
-                char_idx += 1
 
-    _draw_footer(img, draw, x, y,
+    _draw_footer(img, x, y,
                  CARD_W, CARD_H, FOOTER_PAD_LEFT, FOOTER_PAD_BOTTOM,
                  FOOTER_H, LOGO_FONT_SIZE, PACK_FONT_SIZE, 8,
                  is_black=True, pack_id=pack_id, pack_name=pack_name)
@@ -535,6 +702,39 @@ def _draw_black_card_filled(img, x, y, card_text, answers,
 
 # ── Public API ───────────────────────────────────────────────────────────────
 
+def _png(img: Image.Image) -> io.BytesIO:
+    # Attachments are sent once and thrown away: fast zlib beats small files
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+    buf.seek(0)
+    return buf
+
+
+def warm_caches():
+    """
+    Load every font face the cards use, and decode every pack logo next to
+    this script and pre-scale it for both footer sizes, so the first cards a
+    fresh render process draws don't pay for it. Meant to run once per
+    process, before any rendering.
+    """
+    sizes = {CARD_FONT_SIZE, CARD_FONT_SIZE_SMALL, NUMBER_FONT_SIZE, LOGO_FONT_SIZE, PACK_FONT_SIZE,
+             HAND_CARD_FONT_SIZE, HAND_CARD_FONT_SIZE_SMALL, HAND_NUMBER_FONT_SIZE,
+             HAND_LOGO_FONT_SIZE, HAND_PACK_FONT_SIZE}
+    for path in {FONT_BOLD_PATH, FONT_REG_PATH}:
+        for size in sizes:
+            _load_font(path, size)
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    boxes = ((FOOTER_H, (CARD_W - FOOTER_PAD_LEFT * 2) // 2),
+             (HAND_FOOTER_H, (HAND_CARD_W - HAND_FOOTER_PAD_LEFT * 2) // 2))
+    for name in os.listdir(here):
+        pack_id, _, variant = name.removesuffix(".png").rpartition("_")
+        if not name.endswith(".png") or not pack_id or variant not in ("white", "black"):
+            continue
+        for target_h, max_w in boxes:
+            _scaled_logo(pack_id, variant == "white", target_h, max_w)
+
+
 def render_black_card(card_text: str, pick: int = 1,
                       pack_id: str = None, pack_name: str = None,
                       avatar_bytes: bytes = None) -> io.BytesIO:
@@ -544,20 +744,15 @@ def render_black_card(card_text: str, pick: int = 1,
     is drawn centred beneath the card.
     Returns BytesIO PNG.
     """
-    display_text = card_text.replace("_", "_____")
-    if pick > 1:
-        display_text += f"\n\nPICK {pick}"
-
     # Extra canvas height for avatar below the card
     avatar_total = AVATAR_SIZE + AVATAR_BORDER * 2
     avatar_section_h = (AVATAR_BELOW_GAP + avatar_total) if avatar_bytes else 0
 
     canvas_w = CARD_W + CANVAS_PAD * 2
     canvas_h = CARD_H + CANVAS_PAD * 2 + avatar_section_h
-    img = Image.new("RGB", (canvas_w, canvas_h), BG_COLOR)
+    img = _acquire_canvas(canvas_w, canvas_h)
 
-    _draw_card(img, CANVAS_PAD, CANVAS_PAD, is_black=True, text=display_text,
-               bold=True, pack_id=pack_id, pack_name=pack_name)
+    img.paste(_black_tile(card_text, pick, pack_id, pack_name), (CANVAS_PAD, CANVAS_PAD))
 
     if avatar_bytes:
         ax = (canvas_w - avatar_total) // 2
@@ -566,9 +761,8 @@ def render_black_card(card_text: str, pick: int = 1,
                                size=AVATAR_SIZE, border=AVATAR_BORDER,
                                border_color=(255, 255, 255))
 
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
+    buf = _png(img)
+    _release_canvas(img)
     return buf
 
 
@@ -582,10 +776,6 @@ def render_judging(card_text: str, pick: int,
     Render black card + all white submission cards.
     Returns BytesIO PNG.
     """
-    display_text = card_text.replace("_", "_____")
-    if pick > 1:
-        display_text += f"\n\nPICK {pick}"
-
     n_subs = len(submissions)
     cards_per_sub = max(len(s) for s in submissions) if submissions else 1
     sub_h = CARD_H if cards_per_sub == 1 else CARD_H * cards_per_sub + CARD_GAP * (cards_per_sub - 1)
@@ -596,9 +786,11 @@ def render_judging(card_text: str, pick: int,
                 + CANVAS_PAD)
     img = Image.new("RGB", (canvas_w, CANVAS_PAD + total_h + CANVAS_PAD), BG_COLOR)
 
+    # Cards never overlap, so each is drawn on its own tile and pasted in;
+    # per-card work (logo compositing especially) then touches a card-sized
+    # image instead of the whole grid.
     bc_y = CANVAS_PAD + (total_h - CARD_H) // 2
-    _draw_card(img, CANVAS_PAD, bc_y, is_black=True, text=display_text,
-               bold=True, pack_id=black_pack_id, pack_name=black_pack_name)
+    img.paste(_black_tile(card_text, pick, black_pack_id, black_pack_name), (CANVAS_PAD, bc_y))
 
     wx = CANVAS_PAD + CARD_W + CARD_GAP * 2
     for i, sub_cards in enumerate(submissions):
@@ -607,15 +799,20 @@ def render_judging(card_text: str, pick: int,
             wy = CANVAS_PAD + j * (CARD_H + CARD_GAP)
             wpid  = white_pack_ids[i][j]  if white_pack_ids  and i < len(white_pack_ids)  and j < len(white_pack_ids[i])  else None
             wpname = white_pack_names[i][j] if white_pack_names and i < len(white_pack_names) and j < len(white_pack_names[i]) else None
-            _draw_card(img, wx, wy, is_black=False, text=wtext,
-                       number=num if j == 0 else None, bold=False,
-                       pack_id=wpid, pack_name=wpname)
+            tile = _card_tile(is_black=False, text=wtext,
+                              number=num if j == 0 else None, bold=False,
+                              pack_id=wpid, pack_name=wpname)
+            img.paste(tile, (wx, wy))
+            _release_canvas(tile)
         wx += CARD_W + CARD_GAP
 
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
-    return buf
+    # Discord shows the grid far smaller than this anyway; big games are
+    # halved (or more) with a cheap box reduce, which also halves the encode
+    factor = -(-canvas_w // JUDGING_MAX_W)
+    if factor > 1:
+        img = img.reduce(factor)
+
+    return _png(img)
 
 
 def render_winner(card_text: str, answers: list[str],
@@ -627,7 +824,7 @@ def render_winner(card_text: str, answers: list[str],
     border is drawn snugly in the bottom-right corner of the card.
     Returns BytesIO PNG.
     """
-    img = Image.new("RGB", (CARD_W + CANVAS_PAD * 2, CARD_H + CANVAS_PAD * 2), BG_COLOR)
+    img = _acquire_canvas(CARD_W + CANVAS_PAD * 2, CARD_H + CANVAS_PAD * 2)
     _draw_black_card_filled(img, CANVAS_PAD, CANVAS_PAD, card_text, answers,
                             pack_id=pack_id, pack_name=pack_name)
 
@@ -639,9 +836,8 @@ def render_winner(card_text: str, answers: list[str],
                                size=AVATAR_SIZE, border=AVATAR_BORDER,
                                border_color=FILLED_COLOR)  # gold ring for winner
 
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
+    buf = _png(img)
+    _release_canvas(img)
     return buf
 
 
@@ -665,23 +861,22 @@ def render_hand(cards: list[str],
 
     canvas_w = HAND_CANVAS_PAD * 2 + cols * HAND_CARD_W + (cols - 1) * HAND_CARD_GAP
     canvas_h = HAND_CANVAS_PAD * 2 + rows * HAND_CARD_H + (rows - 1) * HAND_CARD_GAP
-    img = Image.new("RGB", (canvas_w, canvas_h), BG_COLOR)
+    img = _acquire_canvas(canvas_w, canvas_h)
 
     for idx, card_text in enumerate(cards):
         col = idx % HAND_COLS
         row = idx // HAND_COLS
         x = HAND_CANVAS_PAD + col * (HAND_CARD_W + HAND_CARD_GAP)
         y = HAND_CANVAS_PAD + row * (HAND_CARD_H + HAND_CARD_GAP)
-        _draw_hand_card(
-            img, x, y, text=card_text, number=idx + 1,
-            pack_id=white_pack_ids.get(card_text),
-            pack_name=white_pack_names.get(card_text),
-            highlight=card_text in pending_set,
-            dimmed=card_text in submitted_set)
-
-    buf = io.BytesIO()
-    img.save(buf, format="PNG", optimize=True)
-    buf.seek(0)
+        tile = _hand_tile(card_text,
+                          white_pack_ids.get(card_text),
+                          white_pack_names.get(card_text),
+                          card_text in pending_set)
+        img.paste(tile, (x - HAND_BLANK_MARGIN, y - HAND_BLANK_MARGIN))
+        _stamp_hand_badge(img, x, y, idx + 1, dimmed=card_text in submitted_set)
+
+    buf = _png(img)
+    _release_canvas(img)
     return buf
 
 